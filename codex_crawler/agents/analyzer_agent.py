@@ -1,15 +1,71 @@
 import re
-import time
-import hashlib
+import asyncio
+import tiktoken
+import xxhash
 import logging
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator
 
-from agents.base_agent import BaseAgent
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
+
+try:
+    import blingfire  # Optional native sentence splitter
+except ImportError:
+    blingfire = None
+
+try:
+    import ahocorasick  # Single-pass multi-term matching
+except ImportError:
+    ahocorasick = None
+
+from agents.base_agent import BaseAgent, AsyncRateLimiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used when splitting content into chunks
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Terms used by validate_ai_relevance, in priority order
+AI_TERMS_TITLE = ['ai', 'artificial intelligence', 'machine learning', 'chatgpt',
+                  'generative ai', 'large language model', 'llm']
+AI_TERMS_CONTENT = AI_TERMS_TITLE + ['neural network', 'deep learning', 'algorithm',
+                                     'data science', 'model', 'gpt', 'transformer']
+# Single-pass fallback when pyahocorasick is unavailable. The lookahead keeps
+# overlapping hits (e.g. 'ai' inside 'generative ai') so counts match str.count.
+_AI_TERMS_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(AI_TERMS_CONTENT, key=len, reverse=True))) + '))'
+)
+
+TAKEAWAY_RULES = (
+    "1. Write a 3-4 sentence focused takeaway (70-90 words)\n"
+    "2. Include specific company names mentioned in the article\n"
+    "3. Include quantitative data when available (revenue, user counts, percentages)\n"
+    "4. Only use statistics from the source text - never fabricate numbers\n"
+    "5. Highlight business impacts and strategic benefits of the AI technology\n"
+    "6. Use clear language without technical jargon\n"
+)
+
+
+class Summary(BaseModel):
+    """Takeaway and key points returned by every summarization prompt"""
+    model_config = ConfigDict(extra='forbid')
+
+    takeaway: str
+    key_points: List[str]
+
+
+class PackedSummaries(BaseModel):
+    """One Summary per article in a packed prompt, in prompt order"""
+    model_config = ConfigDict(extra='forbid')
+
+    results: List[Summary]
+
+
 class AnalyzerAgent(BaseAgent):
     """
     Agent responsible for article content analysis, summarization,
@@ -19,13 +75,45 @@ class AnalyzerAgent(BaseAgent):
     def __init__(self, config=None):
         """Initialize the analyzer agent with configuration"""
         super().__init__(config)
-        self.cache = {}
         self.cache_duration = config.get('cache_duration_hours', 12) if config else 12
+        cache_max_items = config.get('cache_max_items', 1024) if config else 1024
+        # Bounded LRU cache whose entries expire after cache_duration hours
+        self.cache = TTLCache(maxsize=cache_max_items, ttl=self.cache_duration * 3600)
+        self._cache_lock = threading.Lock()
+        # Per-chunk results, so content shared between articles is summarized once
+        chunk_cache_max_items = config.get('chunk_cache_max_items', 4096) if config else 4096
+        self.chunk_cache = TTLCache(maxsize=chunk_cache_max_items, ttl=self.cache_duration * 3600)
+        # TTLCache is not thread-safe; the caller's thread, summarize_article's
+        # pool threads and the event-loop thread share both caches, so all
+        # access goes through their locks
+        self._chunk_cache_lock = threading.Lock()
         self.model = config.get('model', 'gpt-4o-mini') if config else 'gpt-4o-mini'
+        self.max_concurrency = config.get('max_concurrency', 10) if config else 10
+        self.requests_per_minute = config.get('requests_per_minute', 500) if config else 500
+        # Shared by every aprocess call on this agent, so overlapping runs stay
+        # within one concurrency and RPM budget. Coroutines all run on the
+        # shared event loop, which these bind to on first use.
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._rate_limiter = AsyncRateLimiter(self.requests_per_minute)
+        self.use_batch_api = config.get('use_batch_api', False) if config else False
+        # gpt-4o-mini has a 128k-token window; leave headroom for the prompt and output
+        self.context_token_limit = config.get('context_token_limit', 100000) if config else 100000
+        self.chunk_token_size = config.get('chunk_token_size', 3000) if config else 3000
+        self._encoding = self._load_encoding()
+        # Articles shorter than pack_threshold chars are analyzed several to a prompt
+        self.pack_threshold = config.get('pack_threshold', 3000) if config else 3000
+        self.pack_max_articles = config.get('pack_max_articles', 8) if config else 8
+        self.pack_max_tokens = config.get('pack_max_tokens', 6000) if config else 6000
+        self._ai_automaton = self._build_ai_automaton()
         self.log_event("Analyzer agent initialized")
     
     def process(self, articles: List[Dict]) -> List[Dict]:
         """Process a list of articles for analysis"""
+        if self.use_batch_api:
+            return self.process_batch(articles)
+        if self.async_client:
+            return self.run_async(self.aprocess(articles))
+
         self.log_event(f"Analyzing {len(articles)} articles")
         
         analyzed_articles = []
@@ -43,11 +131,269 @@ class AnalyzerAgent(BaseAgent):
                 else:
                     self.log_event(f"Article not relevant or analysis failed: {article['title']}")
             except Exception as e:
-                self.log_event(f"Error analyzing article {article.get('title', 'Unknown')}: {str(e)}", "error")
+                self.log_event(f"Error analyzing article {article.get('title', 'Unknown')}: {str(e)}", level="error")
         
         self.log_event(f"Analysis complete. {len(analyzed_articles)} articles passed validation")
         return analyzed_articles
     
+    def process_batch(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Analyze articles through the OpenAI Batch API. Intended for
+        non-interactive backlog runs where cost matters more than latency.
+        """
+        self.log_event(f"Analyzing {len(articles)} articles via the Batch API")
+
+        # Collect every chunk prompt across all articles in one pass,
+        # sending each distinct chunk (or section group) only once
+        pending = []
+        prompts = []
+        prompt_keys = []
+        prompt_slots = {}
+        summaries = {}
+        for article in articles:
+            content = article.get('content')
+            if not content:
+                self.log_event(f"Article missing content: {article.get('title', 'Unknown')}")
+                continue
+
+            cache_key = f"summary:{self._content_hash(content)}"
+            cached_result = self._get_summary(cache_key)
+            if cached_result is not None:
+                summaries[id(article)] = cached_result
+                pending.append((article, cache_key, []))
+                continue
+
+            slots = []
+            if len(content) < 100:
+                slots.append({"takeaway": "Content too short for meaningful analysis."})
+            elif self._fits_context(content):
+                key = self._chunk_key(content)
+                slots.append(self._get_chunk_result(key) or self._batch_slot(
+                    key, self._build_chunk_prompt, content, prompts, prompt_keys, prompt_slots))
+            else:
+                for group in self._group_chunks(self._iter_token_chunks(content)):
+                    key = tuple(self._chunk_key(chunk) for chunk in group)
+                    slots.append(self._get_chunk_result(key) or self._batch_slot(
+                        key, self._build_sections_prompt, group, prompts, prompt_keys, prompt_slots))
+            pending.append((article, cache_key, slots))
+
+        results = self.execute_ai_prompts_batch(
+            prompts,
+            model=self.model,
+            response_format=Summary
+        )
+        results = [self._cache_chunk_result(key, result)
+                   for key, result in zip(prompt_keys, results)]
+
+        analyzed_articles = []
+        for article, cache_key, slots in pending:
+            try:
+                result = summaries.get(id(article))
+                if result is None:
+                    chunk_summaries = [
+                        slot if isinstance(slot, dict) else results[slot]
+                        for slot in slots
+                    ]
+                    if len(chunk_summaries) == 1:
+                        result = chunk_summaries[0]
+                    else:
+                        result = self._combine_summaries(chunk_summaries)
+                    if result:
+                        self._set_summary(cache_key, result)
+
+                analyzed = self._merge_analysis(article, result) if result else None
+                if analyzed and self.is_relevant(analyzed):
+                    analyzed_articles.append(analyzed)
+                    self.log_event(f"Analyzed and validated article: {article['title']}")
+                else:
+                    self.log_event(f"Article not relevant or analysis failed: {article['title']}")
+            except Exception as e:
+                self.log_event(f"Error analyzing article {article.get('title', 'Unknown')}: {str(e)}", level="error")
+
+        self.log_event(f"Analysis complete. {len(analyzed_articles)} articles passed validation")
+        return analyzed_articles
+
+    def _batch_slot(self, key, build_prompt, content, prompts: List[str],
+                    prompt_keys: List, prompt_slots: Dict) -> int:
+        """Return the batch index for a chunk, queuing its prompt the first time it is seen"""
+        slot = prompt_slots.get(key)
+        if slot is None:
+            slot = prompt_slots[key] = len(prompts)
+            prompts.append(build_prompt(content))
+            prompt_keys.append(key)
+        return slot
+
+    async def aprocess(self, articles: List[Dict]) -> List[Dict]:
+        """Analyze all articles concurrently, bounded by a semaphore and rate limiter"""
+        self.log_event(f"Analyzing {len(articles)} articles concurrently (max {self.max_concurrency} in flight)")
+        candidates = []
+        for article in articles:
+            if 'content' not in article or not article['content']:
+                self.log_event(f"Article missing content: {article['title']}")
+                continue
+            candidates.append(article)
+
+        # Uncached short articles share a prompt; everything else gets its own
+        short, regular = [], []
+        for article in candidates:
+            content = article['content']
+            if (100 <= len(content) < self.pack_threshold and
+                    self._get_summary(f"summary:{self._content_hash(content)}") is None and
+                    self._get_chunk_result(self._chunk_key(content)) is None):
+                short.append(article)
+            else:
+                regular.append(article)
+        units = [[article] for article in regular] + list(self._pack_articles(short))
+        if short:
+            self.log_event(f"Packed {len(short)} short articles into {len(units) - len(regular)} prompts")
+
+        results = await asyncio.gather(*[self._aanalyze_unit(unit) for unit in units],
+                                       return_exceptions=True)
+
+        analyzed_articles = []
+        for unit, unit_results in zip(units, results):
+            if isinstance(unit_results, Exception):
+                for article in unit:
+                    self.log_event(f"Error analyzing article {article.get('title', 'Unknown')}: {str(unit_results)}", level="error")
+                continue
+            for article, result in zip(unit, unit_results):
+                if result and self.is_relevant(result):
+                    analyzed_articles.append(result)
+                    self.log_event(f"Analyzed and validated article: {article['title']}")
+                else:
+                    self.log_event(f"Article not relevant or analysis failed: {article['title']}")
+
+        self.log_event(f"Analysis complete. {len(analyzed_articles)} articles passed validation")
+        return analyzed_articles
+
+    async def _aanalyze(self, article: Dict) -> Optional[Dict]:
+        """Async counterpart of analyze_article"""
+        content = article.get('content')
+        if not content:
+            return None
+
+        summary_data = await self.asummarize_article(content)
+        if not summary_data:
+            return None
+
+        return self._merge_analysis(article, summary_data)
+
+    async def _aanalyze_unit(self, unit: List[Dict]) -> List[Optional[Dict]]:
+        """Analyze a single article, or a pack of short articles in one prompt"""
+        if len(unit) == 1:
+            return [await self._aanalyze(unit[0])]
+
+        summaries = None
+        try:
+            result = await self._arun_prompt(self._build_packed_prompt([a['content'] for a in unit]),
+                                             response_format=PackedSummaries)
+            summaries = self._unpack_results(result, len(unit))
+        except Exception as e:
+            self.log_event(f"Error processing packed articles: {str(e)}", level="error")
+
+        if summaries is None:
+            # Fall back to one prompt per article
+            return list(await asyncio.gather(*[self._aanalyze(article) for article in unit]))
+
+        analyzed = []
+        for article, summary_data in zip(unit, summaries):
+            self._set_chunk_result(self._chunk_key(article['content']), summary_data)
+            self._set_summary(f"summary:{self._content_hash(article['content'])}", summary_data)
+            analyzed.append(self._merge_analysis(article, summary_data))
+        return analyzed
+
+    async def asummarize_article(self, content: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of summarize_article; chunk summaries run concurrently"""
+        content_hash = self._content_hash(content)
+        cache_key = f"summary:{content_hash}"
+
+        cached_result = self._get_summary(cache_key)
+        if cached_result is not None:
+            self.log_event(f"Using cached summary for content hash: {content_hash[:8]}")
+            return cached_result
+
+        if self._fits_context(content):
+            result = await self._aprocess_chunk(content)
+        else:
+            self.log_event(f"Content exceeds context window ({len(content)} chars), using map-reduce")
+            tasks = []
+            for group in self._group_chunks(self._iter_token_chunks(content)):
+                tasks.append(asyncio.ensure_future(self._aprocess_all_chunks(group)))
+                # Yield so the request for this group is sent while the rest is still being split
+                await asyncio.sleep(0)
+            summaries = await asyncio.gather(*tasks)
+            chunk_summaries = [summary for summary in summaries if summary]
+
+            if not chunk_summaries:
+                return None
+
+            if len(chunk_summaries) == 1:
+                result = chunk_summaries[0]
+            else:
+                result = await self._acombine_summaries(chunk_summaries)
+
+        if result:
+            self._set_summary(cache_key, result)
+            return result
+
+        return None
+
+    async def _arun_prompt(self, prompt: str, response_format=Summary) -> Optional[Dict[str, Any]]:
+        """Issue one structured prompt under the concurrency and rate limits"""
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            return await self.aexecute_ai_prompt(
+                prompt=prompt,
+                model=self.model,
+                response_format=response_format
+            )
+
+    async def _aprocess_chunk(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _process_chunk"""
+        if len(chunk) < 100:
+            return {"takeaway": "Content too short for meaningful analysis."}
+
+        key = self._chunk_key(chunk)
+        cached_result = self._get_chunk_result(key)
+        if cached_result is not None:
+            return cached_result
+
+        try:
+            result = await self._arun_prompt(self._build_chunk_prompt(chunk))
+            return self._cache_chunk_result(key, result)
+        except Exception as e:
+            self.log_event(f"Error processing chunk: {str(e)}", level="error")
+            return {"takeaway": "Error occurred during content processing."}
+
+    async def _aprocess_all_chunks(self, chunks: List[str]) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _process_all_chunks"""
+        key = tuple(self._chunk_key(chunk) for chunk in chunks)
+        cached_result = self._get_chunk_result(key)
+        if cached_result is not None:
+            return cached_result
+
+        try:
+            result = await self._arun_prompt(self._build_sections_prompt(chunks))
+            return self._cache_chunk_result(key, result)
+        except Exception as e:
+            self.log_event(f"Error processing sections: {str(e)}", level="error")
+            return {"takeaway": "Error occurred during content processing."}
+
+    async def _acombine_summaries(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async counterpart of _combine_summaries"""
+        if not summaries:
+            return {"takeaway": "No content available to summarize."}
+
+        if len(summaries) == 1:
+            return summaries[0]
+
+        try:
+            result = await self._arun_prompt(self._build_combine_prompt(summaries))
+            return self._finalize_combined_result(result, summaries)
+        except Exception as e:
+            self.log_event(f"Error combining summaries: {str(e)}", level="error")
+            return summaries[0]
+
     def analyze_article(self, article: Dict) -> Optional[Dict]:
         """Analyze a single article with summarization and validation"""
         content = article.get('content')
@@ -59,19 +405,47 @@ class AnalyzerAgent(BaseAgent):
         if not summary_data:
             return None
             
-        # Validate relevance
-        validation = self.validate_ai_relevance({
-            **article,
-            **summary_data
-        })
+        return self._merge_analysis(article, summary_data)
 
-        # Combine everything
-        return {
-            **article,
-            **summary_data,
-            'ai_validation': validation.get('reason', 'Unknown'),
-            'ai_confidence': validation.get('confidence', 0)
-        }
+    def _content_hash(self, content: str) -> str:
+        """Fast non-cryptographic cache key over the whole content"""
+        return xxhash.xxh3_64_hexdigest(content.encode())
+
+    def _chunk_key(self, chunk: str) -> int:
+        """Key for the per-chunk result cache"""
+        return xxhash.xxh3_64(chunk.encode()).intdigest()
+
+    def _get_summary(self, key) -> Optional[Dict[str, Any]]:
+        """Thread-safe lookup in the summary cache"""
+        with self._cache_lock:
+            return self.cache.get(key)
+
+    def _set_summary(self, key, result: Dict[str, Any]):
+        """Thread-safe insert into the summary cache"""
+        with self._cache_lock:
+            self.cache[key] = result
+
+    def _get_chunk_result(self, key) -> Optional[Dict[str, Any]]:
+        """Thread-safe lookup in the per-chunk result cache"""
+        with self._chunk_cache_lock:
+            return self.chunk_cache.get(key)
+
+    def _set_chunk_result(self, key, result: Dict[str, Any]):
+        """Thread-safe insert into the per-chunk result cache"""
+        with self._chunk_cache_lock:
+            self.chunk_cache[key] = result
+
+    def _merge_analysis(self, article: Dict, summary_data: Dict) -> Dict:
+        """Validate relevance and combine the article with its summary"""
+        analyzed = {**article, **summary_data}
+        validation = self._score_ai_relevance(
+            analyzed.get('title', '').lower(),
+            analyzed.get('takeaway', '').lower(),
+            analyzed.get('content') or ''
+        )
+        analyzed['ai_validation'] = validation.get('reason', 'Unknown')
+        analyzed['ai_confidence'] = validation.get('confidence', 0)
+        return analyzed
 
     def is_relevant(self, analyzed_article: Dict) -> bool:
         """Determine if an analyzed article should be kept."""
@@ -82,26 +456,27 @@ class AnalyzerAgent(BaseAgent):
     def summarize_article(self, content: str) -> Optional[Dict[str, Any]]:
         """Generate a summary and takeaway for an article with caching"""
         # Check cache first
-        content_hash = hashlib.md5(content[:10000].encode()).hexdigest()
+        content_hash = self._content_hash(content)
         cache_key = f"summary:{content_hash}"
         
-        if cache_key in self.cache:
-            timestamp, cached_result = self.cache[cache_key]
-            if time.time() - timestamp < (self.cache_duration * 3600):
-                self.log_event(f"Using cached summary for content hash: {content_hash[:8]}")
-                return cached_result
+        cached_result = self._get_summary(cache_key)
+        if cached_result is not None:
+            self.log_event(f"Using cached summary for content hash: {content_hash[:8]}")
+            return cached_result
         
-        # Process content in chunks if too large
-        if len(content) > 12000:
-            self.log_event(f"Content is large ({len(content)} chars), processing in chunks")
-            chunks = self._split_into_chunks(content)
-            chunk_summaries = []
+        if self._fits_context(content):
+            # Whole article fits the model's context window, so one call suffices
+            result = self._process_chunk(content)
+        else:
+            # Map-reduce only when the article exceeds the context window
+            self.log_event(f"Content exceeds context window ({len(content)} chars), using map-reduce")
             
-            for i, chunk in enumerate(chunks):
-                self.log_event(f"Processing chunk {i+1}/{len(chunks)}")
-                summary = self._process_chunk(chunk)
-                if summary:
-                    chunk_summaries.append(summary)
+            # Section groups are network-bound, so summarize them on a thread pool
+            with ThreadPoolExecutor(max_workers=min(8, self.max_concurrency)) as executor:
+                summaries = list(executor.map(self._process_all_chunks,
+                                              self._group_chunks(self._iter_token_chunks(content))))
+            self.log_event(f"Processed {len(summaries)} section groups")
+            chunk_summaries = [summary for summary in summaries if summary]
             
             if not chunk_summaries:
                 return None
@@ -110,106 +485,230 @@ class AnalyzerAgent(BaseAgent):
                 result = chunk_summaries[0]
             else:
                 result = self._combine_summaries(chunk_summaries)
-        else:
-            # Process directly if small enough
-            result = self._process_chunk(content)
         
         # Cache result if valid
         if result:
-            self.cache[cache_key] = (time.time(), result)
+            self._set_summary(cache_key, result)
             return result
         
         return None
     
-    def _split_into_chunks(self, content: str, max_chunk_size: int = 10000) -> List[str]:
-        """Split content into smaller chunks for processing"""
+    def _load_encoding(self):
+        """Tokenizer for the configured model, falling back to the GPT-4o encoding"""
+        try:
+            return tiktoken.encoding_for_model(self.model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+
+    def _count_tokens(self, text: str) -> int:
+        """Number of model tokens in text"""
+        return len(self._encoding.encode_ordinary(text))
+
+    def _fits_context(self, content: str) -> bool:
+        """Whether content fits a single prompt's token budget"""
+        # A token is at least one UTF-8 byte, so short content needs no encoding
+        if len(content) * 4 <= self.context_token_limit:
+            return True
+        return self._count_tokens(content) <= self.context_token_limit
+
+    def _iter_token_chunks(self, content: str, max_tokens: Optional[int] = None) -> Iterator[Tuple[str, int]]:
+        """
+        Yield (chunk, token_count) pairs of at most max_tokens tokens each.
+        Callers only get here once _fits_context has rejected the content, so
+        it is not encoded as a whole again; each sentence is encoded once.
+        """
+        max_tokens = max_tokens or self.chunk_token_size
+
         # Clean and normalize content
-        content = re.sub(r'\s+', ' ', content.strip())
-        
-        if len(content) < max_chunk_size:
-            return [content]
+        content = _WS_RE.sub(' ', content.strip())
             
-        # Split on sentence boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', content)
-        chunks = []
-        current_chunk = []
-        current_size = 0
+        # Track sentence offsets and emit each chunk as one slice of the normalized text
+        chunk_start = None
+        chunk_end = 0
+        current_tokens = 0
         
-        for sentence in sentences:
-            sentence_size = len(sentence)
+        for start, end in self._sentence_spans(content):
+            sentence_tokens = self._encoding.encode_ordinary(content[start:end])
+            sentence_size = len(sentence_tokens)
             
             # Handle very long sentences
-            if sentence_size > max_chunk_size:
-                # Add current chunk if not empty
-                if current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                    current_chunk = []
-                    current_size = 0
+            if sentence_size > max_tokens:
+                # Emit current chunk if not empty
+                if chunk_start is not None:
+                    yield content[chunk_start:chunk_end], current_tokens
+                    chunk_start = None
+                    current_tokens = 0
                 
-                # Split long sentence into fixed-size chunks
-                for i in range(0, len(sentence), max_chunk_size):
-                    chunks.append(sentence[i:i+max_chunk_size])
+                # Split long sentence on token boundaries
+                for i in range(0, sentence_size, max_tokens):
+                    piece = sentence_tokens[i:i + max_tokens]
+                    yield self._encoding.decode(piece), len(piece)
                 continue
             
             # Start a new chunk if adding this sentence would exceed max size
-            if current_size + sentence_size > max_chunk_size:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [sentence]
-                current_size = sentence_size
-            else:
-                current_chunk.append(sentence)
-                current_size += sentence_size
+            if current_tokens + sentence_size > max_tokens:
+                yield content[chunk_start:chunk_end], current_tokens
+                chunk_start = None
+                current_tokens = 0
+                
+            if chunk_start is None:
+                chunk_start = start
+            chunk_end = end
+            current_tokens += sentence_size
         
-        # Add the last chunk if not empty
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
-            
-        self.log_event(f"Split content into {len(chunks)} chunks")
-        return chunks
+        # Emit the last chunk if not empty
+        if chunk_start is not None:
+            yield content[chunk_start:chunk_end], current_tokens
+    
+    def _sentence_spans(self, content: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each sentence in whitespace-normalized content"""
+        if blingfire is not None:
+            _, offsets = blingfire.text_to_sentences_and_offsets(content)
+            yield from offsets
+            return
+        start = 0
+        for match in _SENT_RE.finditer(content):
+            yield start, match.start()
+            start = match.end()
+        yield start, len(content)
     
     def _process_chunk(self, chunk: str) -> Optional[Dict[str, Any]]:
         """Process a single chunk of content for summary and takeaway"""
         if len(chunk) < 100:
             return {"takeaway": "Content too short for meaningful analysis."}
+        
+        key = self._chunk_key(chunk)
+        cached_result = self._get_chunk_result(key)
+        if cached_result is not None:
+            return cached_result
+
+        try:
+            # Call AI model
+            result = self.execute_ai_prompt(
+                prompt=self._build_chunk_prompt(chunk),
+                model=self.model,
+                response_format=Summary
+            )
+            return self._cache_chunk_result(key, result)
             
-        prompt = (
+        except Exception as e:
+            self.log_event(f"Error processing chunk: {str(e)}", level="error")
+            return {"takeaway": "Error occurred during content processing."}
+
+    def _build_chunk_prompt(self, chunk: str) -> str:
+        """Build the takeaway prompt for a single chunk"""
+        return (
             "Analyze this article about AI and create a business-focused takeaway following these rules:\n\n"
-            "1. Write a 3-4 sentence focused takeaway (70-90 words)\n"
-            "2. Include specific company names mentioned in the article\n"
-            "3. Include quantitative data when available (revenue, user counts, percentages)\n"
-            "4. Only use statistics from the source text - never fabricate numbers\n"
-            "5. Highlight business impacts and strategic benefits of the AI technology\n"
-            "6. Use clear language without technical jargon\n\n"
+            f"{TAKEAWAY_RULES}\n"
             "Also extract 3-5 key points from the article.\n\n"
             "Response format: {\"takeaway\": \"...\", \"key_points\": [\"point 1\", \"point 2\", ...]}\n\n"
-            f"Article content:\n{chunk[:12000]}"  # Limit chunk size
+            f"Article content:\n{chunk}"
         )
-        
+
+    def _pack_articles(self, articles: List[Dict]) -> Iterator[List[Dict]]:
+        """Group short articles into packs that fit one prompt"""
+        pack = []
+        pack_tokens = 0
+        for article in articles:
+            # Rough token estimate: ~4 characters per token
+            tokens = len(article['content']) // 4
+            if pack and (len(pack) >= self.pack_max_articles or
+                         pack_tokens + tokens > self.pack_max_tokens):
+                yield pack
+                pack = []
+                pack_tokens = 0
+            pack.append(article)
+            pack_tokens += tokens
+        if pack:
+            yield pack
+
+    def _build_packed_prompt(self, contents: List[str]) -> str:
+        """Build one takeaway prompt covering several short articles"""
+        articles_text = "\n\n".join(
+            f"[{i}]\n{content}" for i, content in enumerate(contents, 1)
+        )
+        return (
+            f"Analyze each of the following {len(contents)} articles about AI and create a "
+            "business-focused takeaway for each one following these rules:\n\n"
+            f"{TAKEAWAY_RULES}\n"
+            "Also extract 3-5 key points from each article.\n\n"
+            f"Return a JSON object with a \"results\" array containing exactly {len(contents)} "
+            "elements, one per article, in the same order as the articles.\n"
+            "Response format: {\"results\": [{\"takeaway\": \"...\", \"key_points\": [\"point 1\", ...]}, ...]}\n\n"
+            f"Articles:\n{articles_text}"
+        )
+
+    def _unpack_results(self, result: Optional[Dict[str, Any]], count: int) -> Optional[List[Dict[str, Any]]]:
+        """Split a packed response into per-article results, or None if it is malformed"""
+        items = result.get("results") if isinstance(result, dict) else None
+        if not isinstance(items, list) or len(items) != count:
+            self.log_event(f"Packed response did not contain {count} results", level="warning")
+            return None
+        return items
+
+    def _group_chunks(self, chunks: Iterable[Tuple[str, int]]) -> Iterator[List[str]]:
+        """Pack consecutive (chunk, token_count) pairs into groups that each fit the context window"""
+        current_group = []
+        current_size = 0
+
+        for chunk, tokens in chunks:
+            if current_group and current_size + tokens > self.context_token_limit:
+                yield current_group
+                current_group = []
+                current_size = 0
+            current_group.append(chunk)
+            current_size += tokens
+
+        if current_group:
+            yield current_group
+
+    def _process_all_chunks(self, chunks: List[str]) -> Optional[Dict[str, Any]]:
+        """Summarize several chunks and synthesize their takeaway in a single call"""
+        key = tuple(self._chunk_key(chunk) for chunk in chunks)
+        cached_result = self._get_chunk_result(key)
+        if cached_result is not None:
+            return cached_result
+
         try:
-            # Call AI model
             result = self.execute_ai_prompt(
-                prompt=prompt,
+                prompt=self._build_sections_prompt(chunks),
                 model=self.model,
-                response_format="json_object"
+                response_format=Summary
             )
-            
-            if not result:
-                self.log_event("Empty or invalid response from AI model", "warning")
-                return {"takeaway": "Unable to generate takeaway from content."}
-                
-            # Ensure required fields exist
-            if "takeaway" not in result:
-                result["takeaway"] = "No takeaway available"
-                
-            if "key_points" not in result or not isinstance(result["key_points"], list):
-                result["key_points"] = []
-                
-            return result
-            
+            return self._cache_chunk_result(key, result)
+
         except Exception as e:
-            self.log_event(f"Error processing chunk: {str(e)}", "error")
+            self.log_event(f"Error processing sections: {str(e)}", level="error")
             return {"takeaway": "Error occurred during content processing."}
+
+    def _build_sections_prompt(self, chunks: List[str]) -> str:
+        """Build a map-reduce prompt that carries every chunk as a numbered section"""
+        sections = "\n\n".join(
+            f"<chunk {i}>\n{chunk}\n</chunk {i}>" for i, chunk in enumerate(chunks, 1)
+        )
+        return (
+            "The article about AI below is split into numbered sections. First summarize each "
+            "section internally, then synthesize a single business-focused takeaway following these rules:\n\n"
+            f"{TAKEAWAY_RULES}\n"
+            "Also extract the 3-5 most important key points across all sections.\n\n"
+            "Response format: {\"takeaway\": \"...\", \"key_points\": [\"point 1\", \"point 2\", ...]}\n\n"
+            f"Article sections:\n{sections}"
+        )
+
+    def _finalize_chunk_result(self, result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Substitute a placeholder when a chunk got no response"""
+        if not result:
+            self.log_event("Empty or invalid response from AI model", level="warning")
+            return {"takeaway": "Unable to generate takeaway from content."}
+        return result
     
+    def _cache_chunk_result(self, key, result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Finalize a chunk response, caching it only when the model answered"""
+        finalized = self._finalize_chunk_result(result)
+        if result:
+            self._set_chunk_result(key, finalized)
+        return finalized
+
     def _combine_summaries(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Combine multiple chunk summaries into a single result"""
         if not summaries:
@@ -217,7 +716,22 @@ class AnalyzerAgent(BaseAgent):
             
         if len(summaries) == 1:
             return summaries[0]
+        
+        try:
+            result = self.execute_ai_prompt(
+                prompt=self._build_combine_prompt(summaries),
+                model=self.model,
+                response_format=Summary
+            )
+            return self._finalize_combined_result(result, summaries)
             
+        except Exception as e:
+            self.log_event(f"Error combining summaries: {str(e)}", level="error")
+            # Return first summary as fallback
+            return summaries[0]
+
+    def _build_combine_prompt(self, summaries: List[Dict[str, Any]]) -> str:
+        """Build the prompt that merges chunk takeaways and key points"""
         # Combine takeaways and key points
         combined_takeaways = " ".join(s.get("takeaway", "") for s in summaries if s)
         all_key_points = []
@@ -227,7 +741,7 @@ class AnalyzerAgent(BaseAgent):
                 all_key_points.extend(summary["key_points"])
         
         # Request AI to synthesize a cohesive summary
-        prompt = (
+        return (
             "Combine these separate takeaways into a single business-focused summary:\n\n"
             f"{combined_takeaways}\n\n"
             "Follow these rules for your combined takeaway:\n"
@@ -240,73 +754,69 @@ class AnalyzerAgent(BaseAgent):
             f"{all_key_points}\n\n"
             "Response format: {\"takeaway\": \"...\", \"key_points\": [\"point 1\", \"point 2\", ...]}"
         )
-        
-        try:
-            result = self.execute_ai_prompt(
-                prompt=prompt,
-                model=self.model,
-                response_format="json_object"
-            )
-            
-            if not result:
-                # Fallback: use first summary
-                self.log_event("Failed to combine summaries, using first summary", "warning")
-                if summaries and len(summaries) > 0:
-                    return summaries[0]
-                return {"takeaway": "Unable to combine summaries."}
-                
-            # Ensure required fields exist
-            if "takeaway" not in result:
-                result["takeaway"] = summaries[0].get("takeaway", "No takeaway available")
-                
-            if "key_points" not in result or not isinstance(result["key_points"], list):
-                for summary in summaries:
-                    if "key_points" in summary and summary["key_points"]:
-                        result["key_points"] = summary["key_points"][:5]
-                        break
-                else:
-                    result["key_points"] = []
-                    
-            return result
-            
-        except Exception as e:
-            self.log_event(f"Error combining summaries: {str(e)}", "error")
-            # Return first summary as fallback
-            if summaries and len(summaries) > 0:
-                return summaries[0]
-            return {"takeaway": "Error combining summaries."}
+
+    def _finalize_combined_result(self, result: Optional[Dict[str, Any]],
+                                  summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fall back to the first chunk summary when the combine call failed"""
+        if not result:
+            self.log_event("Failed to combine summaries, using first summary", level="warning")
+            return summaries[0]
+        return result
     
+    def _build_ai_automaton(self):
+        """Build an Aho-Corasick automaton over the AI relevance terms"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term in AI_TERMS_CONTENT:
+            weight = 50 if term in AI_TERMS_TITLE else 1
+            automaton.add_word(term, (term, weight))
+        automaton.make_automaton()
+        return automaton
+
+    def _count_ai_terms(self, text: str) -> Dict[str, int]:
+        """Count occurrences of each AI term in already-lowercased text"""
+        if self._ai_automaton is not None:
+            counts = {}
+            for _, (term, _weight) in self._ai_automaton.iter(text):
+                counts[term] = counts.get(term, 0) + 1
+            return counts
+        counts = {}
+        for term in _AI_TERMS_RE.findall(text):
+            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def _first_title_term(self, counts: Dict[str, int]) -> Optional[str]:
+        """Return the highest-priority title term present in the counts"""
+        for term in AI_TERMS_TITLE:
+            if counts.get(term):
+                return term
+        return None
+
     def validate_ai_relevance(self, article_data: Dict) -> Dict:
         """Validate if an article is meaningfully about AI technology or applications"""
-        # Extract relevant fields for validation
-        title = article_data.get('title', '').lower()
-        takeaway = article_data.get('takeaway', '').lower()
-        content_sample = article_data.get('content', '')[:5000].lower()
-        
+        return self._score_ai_relevance(
+            article_data.get('title', '').lower(),
+            article_data.get('takeaway', '').lower(),
+            article_data.get('content', '')
+        )
+
+    def _score_ai_relevance(self, title: str, takeaway: str, content: str) -> Dict:
+        """Score AI relevance from already-lowercased title and takeaway and the raw content"""
         # Score tracking
         confidence = 0
         reason = "Not explicitly about AI"
         
         # Title validation (high weight)
-        ai_terms_title = ['ai', 'artificial intelligence', 'machine learning', 'chatgpt', 
-                          'generative ai', 'large language model', 'llm']
-        
-        for term in ai_terms_title:
-            if term in title:
-                confidence += 50
-                reason = f"AI term '{term}' found in title"
-                break
-                
-        # Content validation (medium weight)
-        if confidence < 50:
-            # Count AI terms in content
-            ai_term_count = 0
-            ai_terms_content = ai_terms_title + ['neural network', 'deep learning', 'algorithm', 
-                                                'data science', 'model', 'gpt', 'transformer']
-                                        
-            for term in ai_terms_content:
-                if term in content_sample:
-                    ai_term_count += content_sample.count(term)
+        term = self._first_title_term(self._count_ai_terms(title))
+        if term:
+            confidence += 50
+            reason = f"AI term '{term}' found in title"
+        else:
+            # Content validation (medium weight); a title hit never consults
+            # the content, so only slice and lowercase it when it is needed
+            content_sample = content[:5000].lower()
+            ai_term_count = sum(self._count_ai_terms(content_sample).values())
                     
             if ai_term_count >= 5:
                 confidence += 40
@@ -314,11 +824,10 @@ class AnalyzerAgent(BaseAgent):
                 
         # Takeaway validation (medium weight)
         if confidence < 70 and takeaway:
-            for term in ai_terms_title:
-                if term in takeaway:
-                    confidence += 30
-                    reason = f"AI term '{term}' found in article takeaway"
-                    break
+            term = self._first_title_term(self._count_ai_terms(takeaway))
+            if term:
+                confidence += 30
+                reason = f"AI term '{term}' found in article takeaway"
         
         # Default to pass for articles that made it this far
         is_relevant = confidence >= 40
@@ -327,4 +836,4 @@ class AnalyzerAgent(BaseAgent):
             "is_relevant": is_relevant,
             "confidence": confidence,
             "reason": reason
-        }
\ No newline at end of file
+        }
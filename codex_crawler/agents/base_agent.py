@@ -1,13 +1,101 @@
 import os
+import time
+import asyncio
+import functools
 import logging
+import threading
+from collections import deque
 from datetime import datetime
-import json
-from openai import OpenAI
+from io import BytesIO
+import httpx
+import orjson
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, RateLimitError, InternalServerError
+from pydantic import BaseModel, ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import traceback
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# log_event level names
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Connection pool shared by every agent's OpenAI requests
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Back off and retry completions that failed for transient reasons
+# (connection errors and timeouts, 429s, 5xx)
+_retry_transient = retry(
+    retry=retry_if_exception_type((APIConnectionError, RateLimitError, InternalServerError)),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client(api_key):
+    """Process-wide OpenAI client so all agents share one connection pool"""
+    return OpenAI(api_key=api_key, http_client=httpx.Client(limits=_HTTP_LIMITS))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_async_openai_client(api_key):
+    """Process-wide AsyncOpenAI client, used only on the shared event loop"""
+    return AsyncOpenAI(api_key=api_key, http_client=httpx.AsyncClient(limits=_HTTP_LIMITS))
+
+
+@functools.lru_cache(maxsize=None)
+def _json_schema_format(model):
+    """Strict Structured Outputs response_format for a Pydantic model"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+            "strict": True
+        }
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_event_loop():
+    """
+    Start the process-wide event loop in a daemon thread. The shared async
+    client's connections are bound to this loop, so every coroutine runs here.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True).start()
+    return loop
+
+
+class AsyncRateLimiter:
+    """Sliding-window limiter capping how many requests start per minute"""
+
+    def __init__(self, max_per_minute=500):
+        self.max_per_minute = max_per_minute
+        self._timestamps = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until another request may be started within the current window"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= 60:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_per_minute:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(60 - (now - self._timestamps[0]))
+
+
 class BaseAgent:
     """
     Base class for all agents in the AI News Aggregation system
@@ -19,6 +107,7 @@ class BaseAgent:
         self.config = config or {}
         self.start_time = datetime.now()
         self.api_client = None
+        self.async_client = None
         self.initialize_openai()
         
     def initialize_openai(self):
@@ -26,64 +115,198 @@ class BaseAgent:
         try:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
-                self.api_client = OpenAI(api_key=api_key)
+                self.api_client = _get_openai_client(api_key)
+                self.async_client = _get_async_openai_client(api_key)
                 logger.info(f"{self.__class__.__name__} initialized OpenAI client")
             else:
                 logger.warning(f"{self.__class__.__name__} could not initialize OpenAI client: Missing API key")
         except Exception as e:
             logger.error(f"{self.__class__.__name__} OpenAI initialization error: {str(e)}")
             
-    def log_event(self, message, level="info"):
-        """Standardized logging across all agents"""
+    def log_event(self, message, *args, level="info"):
+        """
+        Standardized logging across all agents. Any args are %-formatted into
+        message by logging, and only if the level is enabled.
+        """
+        levelno = _LOG_LEVELS.get(level)
+        if levelno is None:
+            raise ValueError(f"Unknown log level: {level!r}")
+        if not logger.isEnabledFor(levelno):
+            return
+
         agent_name = self.__class__.__name__
-        
-        if level == "debug":
-            logger.debug(f"[{agent_name}] {message}")
-        elif level == "info":
-            logger.info(f"[{agent_name}] {message}")
-        elif level == "warning":
-            logger.warning(f"[{agent_name}] {message}")
-        elif level == "error":
-            logger.error(f"[{agent_name}] {message}")
-        elif level == "critical":
-            logger.critical(f"[{agent_name}] {message}")
+        if args:
+            logger.log(levelno, "[%s] " + message, agent_name, *args)
+        else:
+            # message may contain a literal %, so it is passed as an argument
+            logger.log(levelno, "[%s] %s", agent_name, message)
             
     def execute_ai_prompt(self, prompt, model="gpt-4o-mini", response_format="text", max_tokens=1500):
         """Execute an AI prompt with standardized error handling"""
         if not self.api_client:
-            self.log_event("No OpenAI client available for prompt execution", "warning")
+            self.log_event("No OpenAI client available for prompt execution", level="warning")
             return None
             
         try:
-            # Set up response format
-            format_config = None
-            if response_format == "json_object":
-                format_config = {"type": "json_object"}
-            
             # Execute the API call
-            response = self.api_client.chat.completions.create(
+            response = self._create_completion(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
-                response_format=format_config,
+                response_format=self._format_config(response_format),
                 max_tokens=max_tokens
             )
             
-            # Extract and process the response
-            content = response.choices[0].message.content if response.choices else None
-            
-            if response_format == "json_object" and content:
-                try:
-                    return json.loads(content)
-                except json.JSONDecodeError as e:
-                    self.log_event(f"Failed to parse JSON response: {e}", "error")
-                    return None
-            
-            return content
+            return self._parse_ai_response(response, response_format)
             
         except Exception as e:
-            self.log_event(f"AI prompt execution error: {str(e)}", "error")
-            self.log_event(traceback.format_exc(), "debug")
+            self.log_event(f"AI prompt execution error: {str(e)}", level="error")
+            if logger.isEnabledFor(logging.DEBUG):
+                self.log_event(traceback.format_exc(), level="debug")
+            return None
+
+    async def aexecute_ai_prompt(self, prompt, model="gpt-4o-mini", response_format="text", max_tokens=1500):
+        """Async counterpart of execute_ai_prompt using the AsyncOpenAI client"""
+        if not self.async_client:
+            self.log_event("No async OpenAI client available for prompt execution", level="warning")
             return None
+
+        try:
+            response = await self._acreate_completion(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format=self._format_config(response_format),
+                max_tokens=max_tokens
+            )
+
+            return self._parse_ai_response(response, response_format)
+
+        except Exception as e:
+            self.log_event(f"AI prompt execution error: {str(e)}", level="error")
+            if logger.isEnabledFor(logging.DEBUG):
+                self.log_event(traceback.format_exc(), level="debug")
+            return None
+
+    @_retry_transient
+    def _create_completion(self, **kwargs):
+        """Chat completion call; retries are handled by _retry_transient, not the SDK"""
+        return self.api_client.with_options(max_retries=0).chat.completions.create(**kwargs)
+
+    @_retry_transient
+    async def _acreate_completion(self, **kwargs):
+        """Async counterpart of _create_completion"""
+        return await self.async_client.with_options(max_retries=0).chat.completions.create(**kwargs)
+
+    def execute_ai_prompts_batch(self, prompts, model="gpt-4o-mini", response_format="text",
+                                 max_tokens=1500, poll_interval=30):
+        """
+        Execute many prompts through the OpenAI Batch API.
+        Returns results aligned with prompts; failed requests come back as None.
+        """
+        if not prompts:
+            return []
+        if not self.api_client:
+            self.log_event("No OpenAI client available for batch execution", level="warning")
+            return [None] * len(prompts)
+
+        try:
+            # Build the JSONL request file
+            lines = []
+            for i, prompt in enumerate(prompts):
+                body = {
+                    "model": model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": max_tokens
+                }
+                format_config = self._format_config(response_format)
+                if format_config:
+                    body["response_format"] = format_config
+                lines.append(orjson.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }))
+            payload = BytesIO(b"\n".join(lines))
+
+            batch_file = self.api_client.files.create(
+                file=("batch_requests.jsonl", payload),
+                purpose="batch"
+            )
+            batch = self.api_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            self.log_event(f"Submitted batch {batch.id} with {len(prompts)} requests")
+
+            # Poll until the batch reaches a terminal state
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = self.api_client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                self.log_event(f"Batch {batch.id} ended with status {batch.status}", level="error")
+                return [None] * len(prompts)
+
+            # Map results back onto the original prompt order
+            results = [None] * len(prompts)
+            output = self.api_client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                choices = response.get("body", {}).get("choices") or []
+                content = choices[0]["message"]["content"] if choices else None
+                results[int(record["custom_id"])] = self._decode_content(content, response_format)
+
+            return results
+
+        except Exception as e:
+            self.log_event(f"Batch execution error: {str(e)}", level="error")
+            if logger.isEnabledFor(logging.DEBUG):
+                self.log_event(traceback.format_exc(), level="debug")
+            return [None] * len(prompts)
+
+    def _format_config(self, response_format):
+        """Map a response format name or Pydantic model onto the chat completions parameter"""
+        if response_format == "json_object":
+            return {"type": "json_object"}
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            return _json_schema_format(response_format)
+        return None
+
+    def _parse_ai_response(self, response, response_format):
+        """Extract the message content, decoding JSON when requested"""
+        content = response.choices[0].message.content if response.choices else None
+        return self._decode_content(content, response_format)
+
+    def _decode_content(self, content, response_format):
+        """Decode raw message content according to the requested format"""
+        if response_format == "json_object" and content:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                self.log_event(f"Failed to parse JSON response: {e}", level="error")
+                return None
+
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            # Structured Outputs guarantee the schema; content is None on a refusal
+            if not content:
+                return None
+            try:
+                return response_format.model_validate_json(content).model_dump()
+            except ValidationError as e:
+                self.log_event(f"Structured response did not match schema: {e}", level="error")
+                return None
+
+        return content
+
+    def run_async(self, coro):
+        """Run a coroutine on the shared event loop and block until it completes"""
+        return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
     
     def process(self, input_data):
         """
@@ -1,22 +1,83 @@
 import os
 import re
-import time
+import asyncio
+import functools
 import logging
+import tempfile
 import hashlib
+import threading
+import httpx
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-import pytz
+from bs4 import BeautifulSoup, SoupStrainer
+from cachetools import TTLCache
 import trafilatura
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from trafilatura.metadata import extract_metadata as extract_page_metadata
 from typing import List, Dict, Optional, Set
 
+try:
+    from diskcache import Cache as DiskCache  # Persistent caches shared across runs
+except ImportError:
+    DiskCache = None
+
 from agents.base_agent import BaseAgent
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Only anchors with an href are needed from source pages
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# AI keywords looked for in link titles. The first branch covers standalone
+# "AI" as well as hyphenated forms such as "AI-powered" and "gen-AI".
+AI_REGEX = re.compile(
+    r'\b(?:[A-Za-z]+-)?AI(?:-[A-Za-z]+)?\b'
+    r'|\bartificial intelligence\b'
+    r'|\bmachine learning\b'
+    r'|\bdeep learning\b'
+    r'|\bneural networks?\b'
+    r'|\bgenerative ai\b'
+    r'|\bchatgpt\b'
+    r'|\b(?:large language model|llm)s?\b',
+    re.IGNORECASE
+)
+
+# Cheap test on a source page's raw bytes: a page matching none of these
+# cannot hold a link whose title matches AI_REGEX, so it is not parsed.
+# Multi-word keywords are reduced to one word since markup may split them.
+AI_PREFILTER_BYTES = re.compile(
+    rb'\bai\b|artificial|machine|deep|neural|generative|chatgpt|language|llm',
+    re.IGNORECASE
+)
+
+# Collapses whitespace runs in extracted article text
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Source pages are truncated after this many bytes
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+DEFAULT_CACHE_DIR = os.environ.get('CRAWLER_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'codex_crawler_cache'))
+
+
+def _parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date as midnight UTC; much cheaper than strptime"""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d'")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_disk_cache(directory, name):
+    """Process-wide disk cache, so every CrawlerAgent shares the same store"""
+    return DiskCache(os.path.join(directory, name), size_limit=2 ** 30)
+
+
 class CrawlerAgent(BaseAgent):
     """
     Agent responsible for crawling websites, extracting links,
@@ -26,106 +87,152 @@ class CrawlerAgent(BaseAgent):
     def __init__(self, config=None):
         """Initialize the crawler agent with configuration"""
         super().__init__(config)
-        self.content_cache = {}
-        self.metadata_cache = {}
         self.max_workers = config.get('max_crawler_workers', 3) if config else 3
         self.cache_duration = config.get('cache_duration_hours', 6) if config else 6
+        cache_max_items = config.get('cache_max_items', 512) if config else 512
+        cache_dir = config.get('cache_dir', DEFAULT_CACHE_DIR) if config else DEFAULT_CACHE_DIR
+        persistent_cache = config.get('persistent_cache', True) if config else True
+        self.cache_ttl = self.cache_duration * 3600
+        # Separate caches whose entries expire after cache_duration hours. With
+        # diskcache they persist across runs and agents; otherwise bounded TTLCaches.
+        if persistent_cache and DiskCache is not None:
+            self.page_cache = _get_disk_cache(cache_dir, 'pages')
+            self.metadata_cache = _get_disk_cache(cache_dir, 'metadata')
+            self.content_cache = _get_disk_cache(cache_dir, 'content')
+        else:
+            self.page_cache = TTLCache(maxsize=cache_max_items, ttl=self.cache_ttl)
+            self.metadata_cache = TTLCache(maxsize=cache_max_items, ttl=self.cache_ttl)
+            self.content_cache = TTLCache(maxsize=cache_max_items, ttl=self.cache_ttl)
+        # Raw HTML of pages that yielded dated metadata, held until their content
+        # is extracted so the page is not downloaded twice
+        html_cache_max_items = config.get('html_cache_max_items', 128) if config else 128
+        self.html_cache = TTLCache(maxsize=html_cache_max_items, ttl=self.cache_ttl)
+        # Extracted text keyed by a hash of the page, shared by identical pages
+        self.extract_cache = TTLCache(maxsize=cache_max_items, ttl=self.cache_ttl)
+        # TTLCache is not thread-safe and source pages are fetched off the event loop
+        self._cache_lock = threading.Lock()
         self.request_timeout = config.get('request_timeout', 10) if config else 10
         self.max_retries = config.get('max_retries', 3) if config else 3
-        self.ai_patterns = [
-            r'\b[Aa][Ii]\b',  # Standalone "AI"
-            r'\b[Aa][Ii]-[a-zA-Z]+\b',  # AI-powered, AI-driven, etc.
-            r'\b[a-zA-Z]+-[Aa][Ii]\b',  # gen-AI, etc.
-            r'\bartificial intelligence\b',
-            r'\bmachine learning\b',
-            r'\bdeep learning\b',
-            r'\bneural network\b',
-            r'\bgenerative ai\b',
-            r'\bchatgpt\b',
-            r'\blarge language model\b',
-            r'\bllm\b'
-        ]
-        self.ai_regex = re.compile('|'.join(self.ai_patterns), re.IGNORECASE)
+        self.max_concurrent_links = config.get('max_concurrent_links', self.max_workers * 8) if config else self.max_workers * 8
+        self.session = self._create_session()
+        # Blocking fetches and parses run here for the agent's lifetime, rather
+        # than on the event loop's default executor
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='crawler')
+        # Article pages are fetched concurrently on the shared event loop
+        self.async_http = httpx.AsyncClient(
+            http2=True,
+            timeout=self.request_timeout,
+            limits=httpx.Limits(max_connections=64),
+            headers={'User-Agent': USER_AGENT},
+            follow_redirects=True
+        )
         self.log_event("Crawler agent initialized")
+
+    def close(self):
+        """Shut down the thread pool and close the HTTP clients"""
+        self._pool.shutdown(wait=True)
+        self.session.close()
+        self.run_async(self.async_http.aclose())
+        self.log_event("Crawler agent closed")
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call on the crawler's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
     
     def process(self, source_urls, cutoff_time=None):
         """Process a list of source URLs to find AI-related articles"""
+        return self.run_async(self.aprocess(source_urls, cutoff_time))
+
+    async def aprocess(self, source_urls, cutoff_time=None):
+        """Crawl all sources concurrently, processing their links concurrently too"""
         if cutoff_time is None:
             days = self.config.get('default_days', 7)
             cutoff_time = datetime.now() - timedelta(days=days)
+        # Make the cutoff timezone aware once instead of per article
+        if cutoff_time.tzinfo is None:
+            cutoff_time = cutoff_time.replace(tzinfo=timezone.utc)
             
         self.log_event(f"Starting crawl of {len(source_urls)} sources with cutoff: {cutoff_time}")
         
         all_articles = []
+        # Shared by every source; all updates happen on the event loop thread
         seen_urls = set()
-        
-        for source_url in source_urls:
+        # Bounds link processing across every source of this crawl
+        link_semaphore = asyncio.Semaphore(self.max_concurrent_links)
+
+        async def crawl(source_url):
             try:
                 self.log_event(f"Processing source: {source_url}")
-                articles = self.crawl_source(source_url, cutoff_time, seen_urls)
-                all_articles.extend(articles)
+                articles = await self.acrawl_source(source_url, cutoff_time, seen_urls, link_semaphore)
                 self.log_event(f"Found {len(articles)} articles from {source_url}")
+                return articles
             except Exception as e:
-                self.log_event(f"Error crawling {source_url}: {str(e)}", "error")
+                self.log_event(f"Error crawling {source_url}: {str(e)}", level="error")
+                return []
+
+        # A slow source no longer holds up the rest; page fetches are bounded
+        # by the thread pool and link processing by the link semaphore
+        for articles in await asyncio.gather(*[crawl(url) for url in source_urls]):
+            all_articles.extend(articles)
         
         self.log_event(f"Crawling complete. Found {len(all_articles)} total articles")
         return all_articles
     
-    def crawl_source(self, source_url: str, cutoff_time: datetime, seen_urls: Set[str]) -> List[Dict]:
+    async def acrawl_source(self, source_url: str, cutoff_time: datetime, seen_urls: Set[str],
+                            link_semaphore: asyncio.Semaphore) -> List[Dict]:
         """Crawl a single source URL to find AI-related articles"""
         # Normalize URL
         if not source_url.startswith(('http://', 'https://')):
             source_url = f'https://{source_url}'
             
-        # Fetch page content (with caching)
-        html_content = self.fetch_page_with_cache(source_url)
-        if not html_content:
+        # Fetching and parsing the source page block, so keep them off the event loop
+        links = await self._run_blocking(self._find_links, source_url)
+        if not links:
             return []
-            
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
         
-        # Find all links
-        links = soup.find_all('a', href=True)
+        # Resolve and dedupe links before any work is scheduled
+        unique_links = {}
+        for link in links:
+            href = urljoin(source_url, link['href'])
+            if href in seen_urls or href in unique_links:
+                continue
+            unique_links[href] = link
+        
+        # Process all links concurrently, bounded by the link semaphore
+        results = await asyncio.gather(*[
+            self._aprocess_link_bounded(link_semaphore, link, href, source_url, cutoff_time)
+            for href, link in unique_links.items()
+        ])
         
-        # Process links - either in parallel or sequentially based on count
         articles = []
-        if len(links) > 5:
-            # Parallel processing for many links
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all links for processing
-                future_to_link = {
-                    executor.submit(self.process_link, link, source_url, cutoff_time, seen_urls): link 
-                    for link in links
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_link):
-                    result = future.result()
-                    if result and result['url'] not in seen_urls:
-                        articles.append(result)
-                        seen_urls.add(result['url'])
-        else:
-            # Sequential processing for few links
-            for link in links:
-                result = self.process_link(link, source_url, cutoff_time, seen_urls)
-                if result and result['url'] not in seen_urls:
-                    articles.append(result)
-                    seen_urls.add(result['url'])
+        for result in results:
+            if result and result['url'] not in seen_urls:
+                articles.append(result)
+                seen_urls.add(result['url'])
         
         return articles
-    
-    def process_link(self, link, source_url: str, cutoff_time: datetime, seen_urls: Set[str]) -> Optional[Dict]:
-        """Process a single link to determine if it's an AI-related article"""
-        try:
-            href = link['href']
-            if not href.startswith(('http://', 'https://')):
-                href = urljoin(source_url, href)
 
-            # Skip if already processed
-            if href in seen_urls:
-                return None
+    def _find_links(self, source_url: str) -> list:
+        """Fetch a source page and return its anchors"""
+        # Fetch page content (with caching)
+        html_content = self.fetch_page_with_cache(source_url)
+        if not html_content:
+            return []
+            
+        # Parse only the links, using the lxml C parser
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=LINK_STRAINER)
+        return soup.find_all('a', href=True)
 
+    async def _aprocess_link_bounded(self, semaphore: asyncio.Semaphore, link, href: str,
+                                     source_url: str, cutoff_time: datetime) -> Optional[Dict]:
+        """Run aprocess_link under the link semaphore"""
+        async with semaphore:
+            return await self.aprocess_link(link, href, source_url, cutoff_time)
+    
+    async def aprocess_link(self, link, href: str, source_url: str, cutoff_time: datetime) -> Optional[Dict]:
+        """Process a single link, already resolved to href, to determine if it's an AI-related article"""
+        try:
             # Extract text from link
             link_text = (link.text or '').strip()
             title = link.get('title', '').strip() or link_text
@@ -135,24 +242,19 @@ class CrawlerAgent(BaseAgent):
                 title = title[len("Permalink to "):]
 
             # Check if title contains AI-related keywords
-            if not self.ai_regex.search(title):
+            if not AI_REGEX.search(title):
                 return None
                 
             self.log_event(f"Found potential AI article: {title}")
             
             # Extract metadata
-            metadata = self.extract_metadata(href, cutoff_time)
+            metadata = await self.aextract_metadata(href, cutoff_time)
             if not metadata:
                 return None
                 
             # Validate date against cutoff
             try:
-                article_date = datetime.strptime(metadata['date'], '%Y-%m-%d')
-                article_date = pytz.UTC.localize(article_date)
-
-                # Ensure cutoff time is timezone aware
-                if not cutoff_time.tzinfo:
-                    cutoff_time = pytz.UTC.localize(cutoff_time)
+                article_date = _parse_ymd(metadata['date'])
 
                 # Only include articles after cutoff date
                 if article_date >= cutoff_time:
@@ -168,156 +270,212 @@ class CrawlerAgent(BaseAgent):
                     self.log_event(f"Article too old, skipping: {title}")
                     return None
             except ValueError as e:
-                self.log_event(f"Date parsing error for {title}: {e}", "error")
+                self.log_event(f"Date parsing error for {title}: {e}", level="error")
                 return None
 
         except Exception as e:
-            self.log_event(f"Error processing link: {str(e)}", "error")
+            self.log_event(f"Error processing link: {str(e)}", level="error")
             return None
     
+    def _create_session(self) -> requests.Session:
+        """Pooled keep-alive session shared by all page fetches, including pool threads"""
+        session = requests.Session()
+        retry = Retry(
+            total=max(self.max_retries - 1, 0),  # max_retries counts the first attempt
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        return session
+
+    def _cache_get(self, cache, key):
+        """Thread-safe lookup in one of the crawler caches"""
+        if not isinstance(cache, TTLCache):
+            return cache.get(key)  # diskcache handles its own locking
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_set(self, cache, key, value):
+        """Thread-safe insert into one of the crawler caches"""
+        if not isinstance(cache, TTLCache):
+            cache.set(key, value, expire=self.cache_ttl)
+            return
+        with self._cache_lock:
+            cache[key] = value
+
+    def _cache_pop(self, cache: TTLCache, key):
+        """Thread-safe removal from one of the in-memory crawler caches"""
+        with self._cache_lock:
+            return cache.pop(key, None)
+
     def fetch_page_with_cache(self, url: str) -> Optional[str]:
-        """Fetch a web page with caching"""
-        cache_key = f"page:{url}"
-        
+        """Fetch a source page with caching; pages without any AI keyword come back empty"""
         # Check cache first
-        if cache_key in self.content_cache:
-            timestamp, cached_content = self.content_cache[cache_key]
-            if time.time() - timestamp < (self.cache_duration * 3600):  # Cache duration in hours
-                self.log_event(f"Using cached page for {url}")
-                return cached_content
+        cached_content = self._cache_get(self.page_cache, url)
+        if cached_content is not None:
+            self.log_event(f"Using cached page for {url}")
+            return cached_content
         
-        # Fetch if not cached
+        # Fetch if not cached; the session's adapter retries with backoff
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            for attempt in range(self.max_retries):
-                try:
-                    if attempt > 0:
-                        # Exponential backoff
-                        wait_time = 2 ** attempt
-                        self.log_event(f"Retry {attempt+1}/{self.max_retries} for {url}, waiting {wait_time}s")
-                        time.sleep(wait_time)
-                        
-                    response = requests.get(url, headers=headers, timeout=self.request_timeout)
-                    response.raise_for_status()
-                    
-                    # Cache the result
-                    self.content_cache[cache_key] = (time.time(), response.text)
-                    return response.text
-                    
-                except (requests.RequestException, ConnectionError) as e:
-                    if attempt == self.max_retries - 1:
-                        raise
-                    self.log_event(f"Request error on attempt {attempt+1}: {str(e)}", "warning")
+            with self.session.get(url, timeout=self.request_timeout, stream=True) as response:
+                response.raise_for_status()
+
+                # Stream the body so oversized pages stop at MAX_PAGE_BYTES
+                chunks = []
+                append = chunks.append
+                total = 0
+                for chunk in response.iter_content(chunk_size=16384):
+                    append(chunk)
+                    total += len(chunk)
+                    if total >= MAX_PAGE_BYTES:
+                        self.log_event(f"Truncated {url} at {MAX_PAGE_BYTES} bytes", level="warning")
+                        break
+                raw = b''.join(chunks)
+                encoding = response.encoding or 'utf-8'
+
+            # Skip decoding and parsing entirely when no link could qualify
+            if not AI_PREFILTER_BYTES.search(raw):
+                self.log_event(f"No AI keywords on {url}, skipping parse", level="debug")
+                html = ''
+            else:
+                html = raw.decode(encoding, errors='replace')
+
+            # Cache the result
+            self._cache_set(self.page_cache, url, html)
+            return html
                     
         except Exception as e:
-            self.log_event(f"Error fetching {url}: {str(e)}", "error")
+            self.log_event(f"Error fetching {url}: {str(e)}", level="error")
             return None
     
-    def extract_metadata(self, url: str, cutoff_time: datetime) -> Optional[Dict]:
+    async def _afetch_html(self, url: str) -> Optional[str]:
+        """Download a page with the shared async client"""
+        response = await self.async_http.get(url)
+        response.raise_for_status()
+        return response.text
+
+    async def _afetch_raw(self, url: str) -> Optional[str]:
+        """Download a page, reusing the HTML kept from its metadata pass if present"""
+        downloaded = self._cache_pop(self.html_cache, url)
+        if downloaded is not None:
+            return downloaded
+        return await self._afetch_html(url)
+
+    async def _aextract_text(self, downloaded: str) -> Optional[str]:
+        """Run trafilatura.extract, caching the result by a hash of the page"""
+        key = hashlib.blake2b(downloaded.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        content = self._cache_get(self.extract_cache, key)
+        if content is not None:
+            return content
+
+        content = await self._run_blocking(
+            trafilatura.extract,
+            downloaded,
+            include_links=True,
+            include_images=True,
+            include_tables=True,
+            with_metadata=False,
+            favor_recall=True
+        )
+        if content:
+            self._cache_set(self.extract_cache, key, content)
+        return content
+
+    async def aextract_metadata(self, url: str, cutoff_time: datetime) -> Optional[Dict]:
         """Extract metadata from an article URL with caching"""
-        cache_key = f"metadata:{url}"
-        
         # Check cache first
-        if cache_key in self.metadata_cache:
-            timestamp, cached_metadata = self.metadata_cache[cache_key]
-            if time.time() - timestamp < (self.cache_duration * 3600):
-                self.log_event(f"Using cached metadata for {url}")
-                return cached_metadata
+        cached_metadata = self._cache_get(self.metadata_cache, url)
+        if cached_metadata is not None:
+            self.log_event(f"Using cached metadata for {url}")
+            return cached_metadata
         
         # Extract if not cached
         try:
-            downloaded = trafilatura.fetch_url(url)
+            downloaded = await self._afetch_html(url)
             if not downloaded:
                 self.log_event(f"Failed to download content from {url}")
                 return None
                 
-            metadata = trafilatura.extract(
-                downloaded,
-                include_links=True,
-                include_images=True,
-                include_tables=True,
-                with_metadata=True,
-                output_format='json',
-                favor_recall=True
-            )
+            # Only the metadata is needed, so skip body extraction and JSON
+            # serialization; parsing is CPU-bound, so run it off the event loop
+            metadata = await self._run_blocking(extract_page_metadata, downloaded, default_url=url)
             
-            if metadata:
-                try:
-                    import json
-                    meta_dict = json.loads(metadata)
-                    result = {
-                        'title': meta_dict.get('title', '').strip(),
-                        'date': meta_dict.get('date', datetime.now(pytz.UTC).strftime('%Y-%m-%d')),
-                        'url': url
-                    }
-                    
-                    # Cache the result
-                    self.metadata_cache[cache_key] = (time.time(), result)
-                    return result
-                    
-                except json.JSONDecodeError as e:
-                    self.log_event(f"JSON parsing error for {url}: {e}", "error")
-                    # Fallback metadata
-                    result = {
-                        'title': "Article from " + url.split('/')[2],
-                        'date': datetime.now(pytz.UTC).strftime('%Y-%m-%d'),
-                        'url': url
-                    }
-                    return result
+            if metadata and metadata.date:
+                result = {
+                    'title': (metadata.title or '').strip(),
+                    'date': metadata.date,
+                    'url': url
+                }
+                
+                # Cache the result, and keep the page for content extraction
+                self._cache_set(self.metadata_cache, url, result)
+                self._cache_set(self.html_cache, url, downloaded)
+                return result
                     
         except Exception as e:
-            self.log_event(f"Error extracting metadata from {url}: {str(e)}", "error")
+            self.log_event(f"Error extracting metadata from {url}: {str(e)}", level="error")
             return None
             
         return None
     
     def extract_full_content(self, url: str) -> Optional[str]:
         """Extract full content from an article URL with caching"""
-        cache_key = f"content:{url}"
-        
+        return self.run_async(self.aextract_full_content(url))
+
+    def extract_full_contents(self, urls: List[str]) -> List[Optional[str]]:
+        """Extract full content for many URLs concurrently, in the order given"""
+        return self.run_async(self.aextract_full_contents(urls))
+
+    async def aextract_full_contents(self, urls: List[str]) -> List[Optional[str]]:
+        """Async counterpart of extract_full_contents"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_links)
+
+        async def bounded(url):
+            async with semaphore:
+                return await self.aextract_full_content(url)
+
+        return await asyncio.gather(*[bounded(url) for url in urls])
+
+    async def aextract_full_content(self, url: str) -> Optional[str]:
+        """Async counterpart of extract_full_content"""
         # Check cache first
-        if cache_key in self.content_cache:
-            timestamp, cached_content = self.content_cache[cache_key]
-            if time.time() - timestamp < (self.cache_duration * 3600):
-                self.log_event(f"Using cached content for {url}")
-                return cached_content
+        cached_content = self._cache_get(self.content_cache, url)
+        if cached_content is not None:
+            self.log_event(f"Using cached content for {url}")
+            return cached_content
         
-        # Extract if not cached
-        for attempt in range(self.max_retries):
+        # Extract if not cached; bind loop-invariant lookups once
+        retries = self.max_retries
+        log = self.log_event
+        for attempt in range(retries):
             try:
-                downloaded = trafilatura.fetch_url(url)
+                downloaded = await self._afetch_raw(url)
                 if downloaded:
-                    content = trafilatura.extract(
-                        downloaded,
-                        include_links=True,
-                        include_images=True,
-                        include_tables=True,
-                        with_metadata=False,
-                        favor_recall=True
-                    )
+                    content = await self._aextract_text(downloaded)
                     
                     if content:
                         # Clean and normalize content
-                        content = re.sub(r'\s+', ' ', content).strip()
+                        content = WHITESPACE_RE.sub(' ', content).strip()
                         
                         # Cache the result
-                        self.content_cache[cache_key] = (time.time(), content)
+                        self._cache_set(self.content_cache, url, content)
                         return content
                         
                 # Retry with exponential backoff
-                if attempt < self.max_retries - 1:
+                if attempt < retries - 1:
                     wait_time = 2 ** attempt
-                    self.log_event(f"Retry {attempt+1}/{self.max_retries} for content extraction from {url}")
-                    time.sleep(wait_time)
+                    log(f"Retry {attempt+1}/{retries} for content extraction from {url}")
+                    await asyncio.sleep(wait_time)
                     
             except Exception as e:
-                self.log_event(f"Error extracting content from {url}: {str(e)}", "error")
-                if attempt < self.max_retries - 1:
+                log(f"Error extracting content from {url}: {str(e)}", "error")
+                if attempt < retries - 1:
                     wait_time = 2 ** attempt
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                     
-        self.log_event(f"Failed to extract content from {url} after {self.max_retries} attempts", "warning")
+        log(f"Failed to extract content from {url} after {retries} attempts", "warning")
         return None
\ No newline at end of file
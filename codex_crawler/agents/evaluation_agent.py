@@ -1,6 +1,76 @@
 import re
+
+try:
+    import ahocorasick  # Single-pass multi-term matching
+except ImportError:
+    ahocorasick = None
+
 from agents.base_agent import BaseAgent
 
+# Criteria keywords, matched against lowercased article text in a single scan.
+# The lookahead tests every position without consuming text, so a keyword
+# inside another group's match (e.g. "own" in "growth") is still seen.
+CRITERIA_RE = re.compile(
+    r"(?=(?P<usage>uses|using|leverages|adopts|deploys|implements|powered by)"
+    r"|(?P<own>own|homegrown|proprietary|in-house)"
+    r"|(?P<roi>\d+%|\$\d|roi|return on investment|savings|increase|decrease|growth|improvement|cost savings|reduced)"
+    r"|(?P<focus>ecommerce|retail|personalization|recommendation|shopping|supply chain|logistics|business intelligence|enterprise chat|creative|content|merchandising|inventory)"
+    r"|(?P<promo>partner|partnership|sponsor|press release|promotion)"
+    r"|(?P<exclude>customer service|customer support|call center|visionary|future of))"
+)
+CRITERIA_FLAGS = frozenset(CRITERIA_RE.groupindex)
+# (name, notes when met, notes when not met) for each criterion, in report
+# order. Met notes are formatted with the company and tool found.
+CRITERIA_TEMPLATE = (
+    ("Company uses AI tool", "{company} uses {tool}", "No real usage found"),
+    ("Uses market GenAI tool", "{tool}", "No GenAI tool mentioned"),
+    ("Measurable ROI", "Impact metrics present", "No clear metrics"),
+    ("Relevant to focus", "Matches focus keywords", "Not aligned"),
+    ("Neutral tone", "Neutral", "Promotional/partnership"),
+    ("Exclude support/visionary", "Meets requirement", "Service or visionary focus"),
+    ("Major platform update", "Update detected", "No major update"),
+)
+# Every criterion but the last counts toward the score
+SCORED_CRITERIA = len(CRITERIA_TEMPLATE) - 1
+MAJOR_UPDATE_RE = re.compile(r"(openai|microsoft|google|amazon|walmart|e-?bay).*?(release|update|launch|announce|rollout)")
+GENAI_RE = re.compile(r"generative ai|large language model|llm")
+
+# Needs capitalization, so it is matched against the original-case text
+FALLBACK_ORG_RE = re.compile(r"\b([A-Z][A-Za-z&]+(?:\s+[A-Z][A-Za-z&]+){0,2}\s+(?:Inc|Corp|Corporation|LLC|Ltd|Group|Co))\b")
+
+WORD_RE = re.compile(r"\w+")
+
+
+def _names_lookup(names):
+    """
+    (name, word set, pattern) per name for token-set matching. Multi-word names
+    such as "Stable Diffusion" or "GPT-4" also get a whole-phrase pattern that
+    confirms the words are adjacent once they are all known to be present.
+    """
+    lookup = []
+    for name in names:
+        lowered = name.lower()
+        words = frozenset(WORD_RE.findall(lowered))
+        pattern = None if WORD_RE.fullmatch(lowered) else re.compile(rf"\b{re.escape(lowered)}\b")
+        lookup.append((name, words, pattern))
+    return tuple(lookup)
+
+
+def _names_automaton(names):
+    """Aho-Corasick automaton over the lowercased names, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, name in enumerate(names):
+        automaton.add_word(name.lower(), (index, len(name)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char):
+    """Mirror of the regex \\w class"""
+    return char.isalnum() or char == "_"
+
 
 class EvaluationAgent(BaseAgent):
     """Evaluate articles against selection criteria."""
@@ -17,6 +87,11 @@ class EvaluationAgent(BaseAgent):
         "Llama", "Bedrock"
     ]
 
+    COMPANY_LOOKUP = _names_lookup(COMPANIES)
+    TOOL_LOOKUP = _names_lookup(TOOLS)
+    COMPANY_AC = _names_automaton(COMPANIES)
+    TOOL_AC = _names_automaton(TOOLS)
+
     def __init__(self, config=None):
         super().__init__(config)
 
@@ -28,20 +103,42 @@ class EvaluationAgent(BaseAgent):
             evaluated.append(article)
         return evaluated
 
-    def _find_company(self, text):
-        for name in self.COMPANIES:
-            if re.search(rf"\b{re.escape(name)}\b", text, re.IGNORECASE):
+    def _first_listed(self, automaton, lookup, names, text_lower, words):
+        """Return the earliest entry of names found in lowercased text as a whole word, scanning it once"""
+        if automaton is not None:
+            best = None
+            for end, (index, length) in automaton.iter(text_lower):
+                if best is not None and index >= best:
+                    continue
+                start = end - length + 1
+                # Substring hits only count on word boundaries, like \b in the regex
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                    continue
+                best = index
+            return names[best] if best is not None else None
+
+        # Without pyahocorasick, compare against the article's word set
+        for name, name_words, pattern in lookup:
+            if name_words <= words and (pattern is None or pattern.search(text_lower)):
                 return name
-        match = re.search(r"\b([A-Z][A-Za-z&]+(?:\s+[A-Z][A-Za-z&]+){0,2}\s+(?:Inc|Corp|Corporation|LLC|Ltd|Group|Co))\b", text)
+        return None
+
+    def _find_company(self, text, text_lower, words):
+        name = self._first_listed(self.COMPANY_AC, self.COMPANY_LOOKUP, self.COMPANIES, text_lower, words)
+        if name:
+            return name
+        match = FALLBACK_ORG_RE.search(text)
         if match:
             return match.group(1)
         return None
 
-    def _find_tool(self, text):
-        for name in self.TOOLS:
-            if re.search(rf"\b{re.escape(name)}\b", text, re.IGNORECASE):
-                return name
-        if re.search(r"generative ai|large language model|llm", text, re.IGNORECASE):
+    def _find_tool(self, text_lower, words):
+        name = self._first_listed(self.TOOL_AC, self.TOOL_LOOKUP, self.TOOLS, text_lower, words)
+        if name:
+            return name
+        if GENAI_RE.search(text_lower):
             return "Generative AI"
         return None
 
@@ -49,62 +146,39 @@ class EvaluationAgent(BaseAgent):
         text = f"{article.get('title','')} {article.get('content','')} {article.get('takeaway','')}"
         text_lower = text.lower()
 
-        criteria = []
-        score = 0
-
-        # Criterion 1: company using AI tool
-        company = self._find_company(text)
-        tool = self._find_tool(text)
-        if company and tool and re.search(r"uses|using|leverages|adopts|deploys|implements|powered by", text_lower):
-            criteria.append({"criteria": "Company uses AI tool", "status": True, "notes": f"{company} uses {tool}"})
-            score += 1
-        else:
-            criteria.append({"criteria": "Company uses AI tool", "status": False, "notes": "No real usage found"})
-
-        # Criterion 2: uses market GenAI tool
-        if tool and not re.search(r"own|homegrown|proprietary|in-house|its own", text_lower):
-            criteria.append({"criteria": "Uses market GenAI tool", "status": True, "notes": tool})
-            score += 1
-        elif re.search(r"own|homegrown|proprietary|in-house", text_lower):
-            criteria.append({"criteria": "Uses market GenAI tool", "status": False, "notes": "Building own platform"})
-        else:
-            criteria.append({"criteria": "Uses market GenAI tool", "status": False, "notes": "No GenAI tool mentioned"})
-
-        # Criterion 3: measurable ROI or impact
-        if re.search(r"\d+%|\$\d|roi|return on investment|savings|increase|decrease|growth|improvement|cost savings|reduced", text_lower):
-            criteria.append({"criteria": "Measurable ROI", "status": True, "notes": "Impact metrics present"})
-            score += 1
-        else:
-            criteria.append({"criteria": "Measurable ROI", "status": False, "notes": "No clear metrics"})
-
-        # Criterion 4: relevant to focus areas
-        if re.search(r"ecommerce|retail|personalization|recommendation|shopping|supply chain|logistics|business intelligence|enterprise chat|creative|content|merchandising|inventory", text_lower):
-            criteria.append({"criteria": "Relevant to focus", "status": True, "notes": "Matches focus keywords"})
-            score += 1
-        else:
-            criteria.append({"criteria": "Relevant to focus", "status": False, "notes": "Not aligned"})
-
-        # Criterion 5: neutral, not promotional
-        if re.search(r"partner|partnership|sponsor|press release|promotion", text_lower):
-            criteria.append({"criteria": "Neutral tone", "status": False, "notes": "Promotional/partnership"})
-        else:
-            criteria.append({"criteria": "Neutral tone", "status": True, "notes": "Neutral"})
-            score += 1
-
-        # Criterion 6: exclude customer service or visionary
-        if re.search(r"customer service|customer support|call center|visionary|future of", text_lower):
-            criteria.append({"criteria": "Exclude support/visionary", "status": False, "notes": "Service or visionary focus"})
-        else:
-            criteria.append({"criteria": "Exclude support/visionary", "status": True, "notes": "Meets requirement"})
-            score += 1
-
-        # Criterion 7: major platform update
-        if re.search(r"(openai|microsoft|google|amazon|walmart|e-?bay).*?(release|update|launch|announce|rollout)", text_lower):
-            criteria.append({"criteria": "Major platform update", "status": True, "notes": "Update detected"})
-            major_update = True
-        else:
-            criteria.append({"criteria": "Major platform update", "status": False, "notes": "No major update"})
-            major_update = False
+        flags = set()
+        for match in CRITERIA_RE.finditer(text_lower):
+            flags.add(match.lastgroup)
+            if len(flags) == len(CRITERIA_FLAGS):
+                break
+
+        # Tokenize once for both lookups; the automata scan the raw text instead
+        words = set(WORD_RE.findall(text_lower)) if ahocorasick is None else None
+        company = self._find_company(text, text_lower, words)
+        tool = self._find_tool(text_lower, words)
+        major_update = MAJOR_UPDATE_RE.search(text_lower) is not None
+
+        # One condition per CRITERIA_TEMPLATE entry; "its own" always contains
+        # "own", so one flag covers the own-platform check
+        conditions = (
+            bool(company and tool) and "usage" in flags,
+            bool(tool) and "own" not in flags,
+            "roi" in flags,
+            "focus" in flags,
+            "promo" not in flags,
+            "exclude" not in flags,
+            major_update,
+        )
+        # The major update criterion overrides the assessment instead of scoring
+        score = sum(conditions[:SCORED_CRITERIA])
+
+        criteria = [
+            {"criteria": name, "status": status,
+             "notes": met.format(company=company, tool=tool) if status else unmet}
+            for (name, met, unmet), status in zip(CRITERIA_TEMPLATE, conditions)
+        ]
+        if not conditions[1] and "own" in flags:
+            criteria[1]["notes"] = "Building own platform"
 
         # Assessment determination
         if major_update:
@@ -116,7 +190,7 @@ class EvaluationAgent(BaseAgent):
         else:
             assessment = "CUT"
 
-        assessment_score = int((score / 6) * 100)
+        assessment_score = int((score / SCORED_CRITERIA) * 100)
 
         return {
             "criteria_results": criteria,
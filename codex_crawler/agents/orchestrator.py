@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import time
 import json
+import weakref
 
 from agents.base_agent import BaseAgent
 from agents.crawler_agent import CrawlerAgent
@@ -29,6 +30,10 @@ class Orchestrator:
         self.analyzer = AnalyzerAgent(self.config.get('analyzer_config', {}))
         self.evaluator = EvaluationAgent(self.config.get('evaluation_config', {}))
         self.reporter = ReportAgent(self.config.get('report_config', {}))
+        # Streamlit drops a session's orchestrator without calling close(), so
+        # the crawler's pool and HTTP clients are also released when it is
+        # garbage collected or the interpreter exits
+        self._finalizer = weakref.finalize(self, self.crawler.close)
         
         # Processing state
         self.articles = []
@@ -39,6 +44,10 @@ class Orchestrator:
         
         logger.info("Orchestrator initialized with all agents ready")
     
+    def close(self):
+        """Release agent resources; safe to call more than once"""
+        self._finalizer()
+
     def update_status(self, message):
         """Update processing status with timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -90,11 +99,13 @@ class Orchestrator:
             # Step 2: Analyze and validate articles
             self.update_status("Analyzing article content...")
             
-            # First, fetch full content for any articles that don't have it
-            for article in self.articles:
-                if not article.get('content'):
-                    self.update_status(f"Fetching content for: {article['title']}")
-                    article['content'] = self.crawler.extract_full_content(article['url'])
+            # First, fetch full content for any articles that don't have it, concurrently
+            missing = [article for article in self.articles if not article.get('content')]
+            if missing:
+                self.update_status(f"Fetching content for {len(missing)} articles")
+                contents = self.crawler.extract_full_contents([article['url'] for article in missing])
+                for article, content in zip(missing, contents):
+                    article['content'] = content
             
             filtered_articles = [a for a in self.articles if a.get('content')]
             self.update_status(f"Analyzing {len(filtered_articles)} articles with content")
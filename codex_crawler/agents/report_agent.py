@@ -1,21 +1,118 @@
 import os
+import csv
 import logging
 import json
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, StringIO
 from typing import List, Dict, Any, Optional
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-import pandas as pd
+import numpy as np
 
 from agents.base_agent import BaseAgent
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+# Article fields read by the report generators, with their fallbacks. Each
+# article is merged over the defaults once and unpacked in a single call.
+_ROW_DEFAULTS = {
+    'title': '', 'url': '', 'date': '', 'source': '', 'takeaway': '',
+    'assessment': '', 'assessment_score': 0, 'key_points': [], 'criteria_results': []
+}
+_PDF_DEFAULTS = {
+    'title': 'Untitled Article', 'url': '', 'date': 'Unknown date', 'source': 'Unknown source',
+    'takeaway': 'No takeaway available', 'assessment': 'N/A', 'assessment_score': 0,
+    'key_points': [], 'criteria_results': []
+}
+_REPORT_FIELDS = operator.itemgetter(
+    'title', 'url', 'date', 'source', 'takeaway',
+    'assessment', 'assessment_score', 'key_points', 'criteria_results'
+)
+
+# Formats ReportAgent can generate, all of them by default
+REPORT_FORMATS = ('pdf', 'csv', 'excel')
+
+# Paragraph parses its text as markup, so article text is escaped first; the
+# quote matters because URLs go inside a single-quoted href attribute
+_HTML_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', "'": '&#39;'})
+
+# Vertical space reserved on the first page for the report header
+REPORT_HEADER_HEIGHT = 90
+
+
+def _draw_report_header(canvas, doc, title, subtitle):
+    """Draw the fixed report header straight onto the first page's canvas"""
+    top = doc.bottomMargin + doc.height
+    canvas.saveState()
+    canvas.setFont('Helvetica-Bold', 18)
+    canvas.drawString(doc.leftMargin, top - 18, title)
+    canvas.setFont('Helvetica-Bold', 14)
+    canvas.drawString(doc.leftMargin, top - 64, subtitle)
+    canvas.restoreState()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_styles():
+    """Paragraph and table styles for the PDF report, built once on first use"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    normal_style = styles['Normal']
+    return {
+        'subtitle': styles['Heading2'],
+        'normal': normal_style,
+        # Article content
+        'article': ParagraphStyle(
+            'ArticleStyle',
+            parent=normal_style,
+            spaceAfter=12,
+            spaceBefore=6
+        ),
+        # Boxed article takeaway
+        'takeaway': ParagraphStyle(
+            'TakeawayStyle',
+            parent=normal_style,
+            leftIndent=20,
+            rightIndent=20,
+            spaceAfter=12,
+            spaceBefore=12,
+            borderWidth=1,
+            borderColor=colors.lightgrey,
+            borderPadding=10,
+            borderRadius=5,
+            backColor=colors.lightgrey
+        ),
+        'criteria_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.whitesmoke),
+            ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ]),
+        # Single-column table holding one article, one row per section
+        'article_table': TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]),
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse an article's ISO date, memoized since articles share dates; None if invalid"""
+    try:
+        # Scores compare against naive local times
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
 class ReportAgent(BaseAgent):
     """
     Agent responsible for generating reports from analyzed articles
@@ -26,12 +123,14 @@ class ReportAgent(BaseAgent):
         """Initialize the report agent with configuration"""
         super().__init__(config)
         self.max_articles = config.get('max_report_articles', 10) if config else 10
+        # Report formats to generate; the others come back as None
+        self.formats = set(config.get('formats', REPORT_FORMATS)) if config else set(REPORT_FORMATS)
         self.log_event("Report agent initialized")
     
     def process(self, input_data):
         """Process and rank articles, then generate reports"""
         if not input_data or not isinstance(input_data, list):
-            self.log_event("No articles provided for reporting", "warning")
+            self.log_event("No articles provided for reporting", level="warning")
             return {
                 "selected_articles": [],
                 "pdf_report": None,
@@ -40,26 +139,41 @@ class ReportAgent(BaseAgent):
             }
             
         articles = input_data
-        self.log_event(f"Processing {len(articles)} articles for reporting")
+        self.log_event("Processing %d articles for reporting", len(articles))
         
         # Select and rank the best articles
         selected_articles = self.select_articles(articles)
-        self.log_event(f"Selected {len(selected_articles)} articles for reports")
+        self.log_event("Selected %d articles for reports", len(selected_articles))
         
-        # Generate reports in different formats
+        # Generate the requested report formats; they are independent, so
+        # build them concurrently
         try:
-            pdf_data = self.generate_pdf_report(selected_articles)
-            csv_data = self.generate_csv_report(selected_articles)
-            excel_data = self.generate_excel_report(selected_articles)
+            jobs = {}
+            if 'pdf' in self.formats:
+                jobs['pdf'] = (self.generate_pdf_report, selected_articles)
+            if self.formats & {'csv', 'excel'}:
+                # CSV and Excel share one set of rows
+                fieldnames, rows = self._build_report_rows(selected_articles)
+                if 'csv' in self.formats:
+                    jobs['csv'] = (self.generate_csv_report, fieldnames, rows)
+                if 'excel' in self.formats:
+                    jobs['excel'] = (self.generate_excel_report, fieldnames, rows)
+
+            reports = dict.fromkeys(REPORT_FORMATS)
+            if jobs:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    futures = {name: executor.submit(*job) for name, job in jobs.items()}
+                for name, future in futures.items():
+                    reports[name] = future.result()
             
             return {
                 "selected_articles": selected_articles,
-                "pdf_report": pdf_data,
-                "csv_report": csv_data,
-                "excel_report": excel_data
+                "pdf_report": reports['pdf'],
+                "csv_report": reports['csv'],
+                "excel_report": reports['excel']
             }
         except Exception as e:
-            self.log_event(f"Error generating reports: {str(e)}", "error")
+            self.log_event(f"Error generating reports: {str(e)}", level="error")
             return {
                 "selected_articles": selected_articles,
                 "pdf_report": None,
@@ -72,29 +186,65 @@ class ReportAgent(BaseAgent):
         if not articles:
             return []
             
-        # Sort articles by date (newest first)
-        sorted_articles = sorted(
-            articles,
-            key=lambda x: datetime.strptime(x.get('date', '2000-01-01'), '%Y-%m-%d'),
-            reverse=True
+        # Parse each date once into one datetime64 array (NaT if invalid); it
+        # serves both the recency score and tie-breaks
+        stamps = np.array(
+            [_parse_date(article.get('date') or '2000-01-01') for article in articles], dtype='datetime64[us]'
         )
-        
-        # Calculate relevance score for each article
-        scored_articles = []
-        for article in sorted_articles:
-            score = self.calculate_relevance_score(article)
-            scored_articles.append((score, article))
-            
-        # Sort by score (highest first)
-        scored_articles.sort(reverse=True, key=lambda x: x[0])
-        
-        # Take top N articles
-        selected = [article for _, article in scored_articles[:self.max_articles]]
+
+        # Score all articles at once, against one reference time
+        scores = self._score_all(articles, stamps, datetime.now())
+
+        # Equal scores go to the newer article, then to input order; invalid
+        # dates rank as oldest (not as NaT, whose int64 overflows when negated)
+        date_rank = np.where(np.isnat(stamps), np.datetime64(datetime.min, 'us'), stamps).view(np.int64)
+
+        # Take the top N by score (highest first) without sorting the rest
+        count = len(articles)
+        k = min(self.max_articles, count)
+        if k <= 0:
+            return []
+        if k < count:
+            kth = np.partition(scores, count - k)[count - k]
+            above = np.flatnonzero(scores > kth)
+            ties = np.flatnonzero(scores == kth)
+            ties = ties[np.lexsort((ties, -date_rank[ties]))][:k - len(above)]
+            candidates = np.concatenate((above, ties))
+        else:
+            candidates = np.arange(count)
+        top = candidates[np.lexsort((candidates, -date_rank[candidates], -scores[candidates]))]
+        selected = [articles[i] for i in top]
         
         return selected
+
+    def _score_all(self, articles: List[Dict], stamps: np.ndarray, now: datetime) -> np.ndarray:
+        """
+        Vectorized calculate_relevance_score over many articles, given their
+        dates as a datetime64[us] array with NaT for invalid dates
+        """
+        count = len(articles)
+        ai_confidence = np.fromiter((float(a.get('ai_confidence', 0)) for a in articles), dtype=np.float64, count=count)
+
+        # Recency: 5 points lost per whole day old; invalid dates get no boost
+        valid = ~np.isnat(stamps)
+        now64 = np.datetime64(now, 'us')
+        days_old = (now64 - np.where(valid, stamps, now64)) // np.timedelta64(1, 'D')
+        recency_score = np.where(valid, np.maximum(0, 100 - days_old * 5), 0)
+
+        # Content quality (based on takeaway and key points)
+        has_takeaway = np.fromiter((len(a.get('takeaway') or '') > 50 for a in articles), dtype=bool, count=count)
+        has_points = np.fromiter((len(a.get('key_points') or []) >= 3 for a in articles), dtype=bool, count=count)
+        quality_score = has_takeaway * 50 + has_points * 50
+
+        # Same weights, summed in the same order, as calculate_relevance_score
+        return ai_confidence * 0.5 + recency_score * 0.3 + quality_score * 0.2
     
-    def calculate_relevance_score(self, article: Dict) -> float:
-        """Calculate a relevance score for an article based on various factors"""
+    def calculate_relevance_score(self, article: Dict, article_date: Optional[datetime] = None,
+                                  now: Optional[datetime] = None) -> float:
+        """
+        Calculate a relevance score for an article. Pass article_date if it is
+        already parsed and now to score many articles against the same time.
+        """
         score = 0.0
         
         # AI Confidence score (0-100)
@@ -102,14 +252,13 @@ class ReportAgent(BaseAgent):
         score += ai_confidence * 0.5  # Weight 50%
         
         # Recency factor (newer articles score higher)
-        try:
-            article_date = datetime.strptime(article.get('date', '2000-01-01'), '%Y-%m-%d')
-            days_old = (datetime.now() - article_date).days
+        if article_date is None:
+            article_date = _parse_date(article.get('date') or '2000-01-01')
+        if article_date is not None:
+            days_old = ((now or datetime.now()) - article_date).days
             recency_score = max(0, 100 - (days_old * 5))  # Lose 5 points per day old
             score += recency_score * 0.3  # Weight 30%
-        except ValueError:
-            # Date parsing failed
-            score += 0  # No recency boost
+        # Otherwise date parsing failed: no recency boost
             
         # Content quality (based on takeaway and key points)
         takeaway = article.get('takeaway', '')
@@ -131,76 +280,59 @@ class ReportAgent(BaseAgent):
             return None
             
         try:
+            # ReportLab is heavy to import, so load it only once a PDF is needed
+            from reportlab.lib.pagesizes import letter
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+            from reportlab.lib.units import inch
+
             buffer = BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
-            
-            # Create custom styles
-            title_style = styles['Heading1']
-            subtitle_style = styles['Heading2']
-            normal_style = styles['Normal']
+            styles = _get_pdf_styles()
+            subtitle_style = styles['subtitle']
+            normal_style = styles['normal']
+            article_style = styles['article']
+            takeaway_style = styles['takeaway']
             
-            # Add custom paragraph style for article content
-            article_style = ParagraphStyle(
-                'ArticleStyle',
-                parent=normal_style,
-                spaceAfter=12,
-                spaceBefore=6
-            )
-            
-            # Add custom paragraph style for article takeaway
-            takeaway_style = ParagraphStyle(
-                'TakeawayStyle',
-                parent=normal_style,
-                leftIndent=20,
-                rightIndent=20,
-                spaceAfter=12,
-                spaceBefore=12,
-                borderWidth=1,
-                borderColor=colors.lightgrey,
-                borderPadding=10,
-                borderRadius=5,
-                backColor=colors.lightgrey
-            )
-            
-            # Create the document content
-            content = []
-            
-            # Add title
+            # The header has a fixed layout, so it is drawn directly on the
+            # canvas; flowables only lay out the wrapped article content
             today = datetime.now().strftime("%Y-%m-%d")
-            content.append(Paragraph(f"AI News Report - {today}", title_style))
-            content.append(Spacer(1, 12))
-            content.append(Paragraph(f"Top {len(articles)} AI Articles", subtitle_style))
-            content.append(Spacer(1, 24))
+            draw_header = functools.partial(
+                _draw_report_header,
+                title=f"AI News Report - {today}",
+                subtitle=f"Top {len(articles)} AI Articles"
+            )
+
+            # Create the document content, below the header
+            content = [Spacer(1, REPORT_HEADER_HEIGHT)]
             
             # Add articles
             for i, article in enumerate(articles, 1):
-                # Article title with link
-                title = article.get('title', 'Untitled Article')
-                url = article.get('url', '')
-                
-                content.append(Paragraph(f"{i}. <a href='{url}'>{title}</a>", subtitle_style))
-                content.append(Spacer(1, 6))
-                
-                # Publication date and source
-                date = article.get('date', 'Unknown date')
-                source = article.get('source', 'Unknown source')
-                content.append(Paragraph(f"Published: {date} | Source: {source}", normal_style))
-                content.append(Spacer(1, 6))
-                
-                # Takeaway
-                takeaway = article.get('takeaway', 'No takeaway available')
-                content.append(Paragraph(f"<b>Key Takeaway:</b> {takeaway}", takeaway_style))
-                
+                (title, url, date, source, takeaway,
+                 assessment, score, key_points, crit_results) = _REPORT_FIELDS({**_PDF_DEFAULTS, **article})
+                safe_title = str(title).translate(_HTML_ESC)
+                safe_url = str(url).translate(_HTML_ESC)
+
+                # Each article is one table flowable with a row per section,
+                # rather than a run of Paragraphs and Spacers; rows can still
+                # break across pages
+                cells = [
+                    # Article title with link
+                    [Paragraph(f"{i}. <a href='{safe_url}'>{safe_title}</a>", subtitle_style), Spacer(1, 6)],
+                    # Publication date and source
+                    [Paragraph(
+                        f"Published: {str(date).translate(_HTML_ESC)} | Source: {str(source).translate(_HTML_ESC)}",
+                        normal_style
+                    ), Spacer(1, 6)],
+                    # Takeaway
+                    [Paragraph(f"<b>Key Takeaway:</b> {str(takeaway).translate(_HTML_ESC)}", takeaway_style)],
+                ]
+
                 # Key points
-                key_points = article.get('key_points', [])
                 if key_points:
-                    content.append(Paragraph("<b>Key Points:</b>", article_style))
-                    for point in key_points:
-                        content.append(Paragraph(f"• {point}", article_style))
+                    cells.append([Paragraph("<b>Key Points:</b>", article_style)])
+                    cells.extend([Paragraph(f"• {str(point).translate(_HTML_ESC)}", article_style)] for point in key_points)
                 
                 # Criteria table
-                crit_results = article.get('criteria_results', [])
                 if crit_results:
                     table_data = [["Criteria", "Status", "Notes"]]
                     for crit in crit_results:
@@ -211,107 +343,108 @@ class ReportAgent(BaseAgent):
                             crit.get('notes', '')
                         ])
                     table = Table(table_data, colWidths=[2.5*inch, 0.6*inch, 3.9*inch])
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.whitesmoke),
-                        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ]))
-                    content.append(table)
-                    content.append(Spacer(1, 6))
-
-                assessment = article.get('assessment', 'N/A')
-                score = article.get('assessment_score', 0)
-                content.append(Paragraph(f"<b>Assessment:</b> {assessment} (Score: {score}%)", article_style))
-
-                # Add space between articles
-                content.append(Spacer(1, 20))
-            
-            # Build the PDF
-            doc.build(content)
-            pdf_data = buffer.getvalue()
-            buffer.close()
+                    table.setStyle(styles['criteria_table'])
+                    cells.append([table, Spacer(1, 6)])
+
+                cells.append([Paragraph(f"<b>Assessment:</b> {str(assessment).translate(_HTML_ESC)} (Score: {score}%)", article_style)])
+
+                # Table cells drop the outer space before/after of their
+                # content, so it becomes row padding, collapsed the way a
+                # frame collapses adjacent spacing; the last row also leaves
+                # the gap before the next article
+                padding = []
+                space_after = 0
+                for row, cell in enumerate(cells):
+                    space_before = max(cell[0].getSpaceBefore() - space_after, 0)
+                    space_after = cell[-1].getSpaceAfter()
+                    padding.append(('TOPPADDING', (0, row), (0, row), space_before))
+                    padding.append(('BOTTOMPADDING', (0, row), (0, row), space_after))
+                padding.append(('BOTTOMPADDING', (0, -1), (0, -1), cells[-1][-1].getSpaceAfter() + 20))
+
+                article_table = Table([[cell] for cell in cells], colWidths=[doc.width], style=styles['article_table'])
+                article_table.setStyle(padding)
+                content.append(article_table)
             
-            return pdf_data
+            # Build the PDF. getvalue() hands over the buffer's bytes rather
+            # than copying them (unlike getbuffer().tobytes()), and callers
+            # such as st.download_button need bytes, not a memoryview
+            doc.build(content, onFirstPage=draw_header)
+            return buffer.getvalue()
             
         except Exception as e:
-            self.log_event(f"Error generating PDF: {str(e)}", "error")
+            self.log_event(f"Error generating PDF: {str(e)}", level="error")
             return None
     
-    def generate_csv_report(self, articles: List[Dict]) -> Optional[bytes]:
-        """Generate a CSV report for the selected articles"""
-        if not articles:
+    def _build_report_rows(self, articles: List[Dict]):
+        """Build the (fieldnames, rows) table shared by the CSV and Excel reports"""
+        rows = []
+        for article in articles:
+            (title, url, date, source, takeaway,
+             assessment, score, key_points, crit_results) = _REPORT_FIELDS({**_ROW_DEFAULTS, **article})
+
+            row = {
+                'Title': title,
+                'URL': url,
+                'Date': date,
+                'Source': source,
+                'Takeaway': takeaway,
+                'Assessment': assessment,
+                'Score': score,
+                # Key points as one string, if there are any
+                'Key Points': "; ".join(key_points) if key_points else "",
+            }
+            for idx, crit in enumerate(crit_results, 1):
+                row[f'C{idx}'] = 'Y' if crit.get('status') else 'N'
+                row[f'C{idx} Notes'] = crit.get('notes', '')
+            rows.append(row)
+            
+        # Columns in order of first appearance, as a DataFrame would have them
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        return fieldnames, rows
+    
+    def generate_csv_report(self, fieldnames: List[str], rows: List[Dict]) -> Optional[bytes]:
+        """Generate a CSV report from the rows built by _build_report_rows"""
+        if not rows:
             return None
             
         try:
-            # Prepare data for CSV
-            data = []
-            for article in articles:
-                # Extract key_points as string if it exists
-                key_points = article.get('key_points', [])
-                key_points_str = "; ".join(key_points) if key_points else ""
-                
-                row = {
-                    'Title': article.get('title', ''),
-                    'URL': article.get('url', ''),
-                    'Date': article.get('date', ''),
-                    'Source': article.get('source', ''),
-                    'Takeaway': article.get('takeaway', ''),
-                    'Assessment': article.get('assessment', ''),
-                    'Score': article.get('assessment_score', 0),
-                    'Key Points': key_points_str,
-                }
-                for idx, crit in enumerate(article.get('criteria_results', []), 1):
-                    row[f'C{idx}'] = 'Y' if crit.get('status') else 'N'
-                    row[f'C{idx} Notes'] = crit.get('notes', '')
-                data.append(row)
-                
-            # Create DataFrame and CSV
-            df = pd.DataFrame(data)
-            csv_buffer = BytesIO()
-            df.to_csv(csv_buffer, index=False)
+            # The csv module is all a plain string table needs
+            csv_buffer = StringIO()
+            writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
             
-            return csv_buffer.getvalue()
+            return csv_buffer.getvalue().encode('utf-8')
             
         except Exception as e:
-            self.log_event(f"Error generating CSV: {str(e)}", "error")
+            self.log_event(f"Error generating CSV: {str(e)}", level="error")
             return None
     
-    def generate_excel_report(self, articles: List[Dict]) -> Optional[bytes]:
-        """Generate an Excel report for the selected articles"""
-        if not articles:
+    def generate_excel_report(self, fieldnames: List[str], rows: List[Dict]) -> Optional[bytes]:
+        """Generate an Excel report from the rows built by _build_report_rows"""
+        if not rows:
             return None
             
         try:
-            # Prepare data for Excel
-            data = []
-            for article in articles:
-                # Extract key_points as string if it exists
-                key_points = article.get('key_points', [])
-                key_points_str = "; ".join(key_points) if key_points else ""
-                
-                row = {
-                    'Title': article.get('title', ''),
-                    'URL': article.get('url', ''),
-                    'Date': article.get('date', ''),
-                    'Source': article.get('source', ''),
-                    'Takeaway': article.get('takeaway', ''),
-                    'Assessment': article.get('assessment', ''),
-                    'Score': article.get('assessment_score', 0),
-                    'Key Points': key_points_str,
-                }
-                for idx, crit in enumerate(article.get('criteria_results', []), 1):
-                    row[f'C{idx}'] = 'Y' if crit.get('status') else 'N'
-                    row[f'C{idx} Notes'] = crit.get('notes', '')
-                data.append(row)
-                
-            # Create DataFrame and Excel
-            df = pd.DataFrame(data)
+            import xlsxwriter  # Loaded only once an Excel report is needed
+
+            # Rows are streamed into the sheet as they are written instead of
+            # being held as a workbook object model; strings stay plain text
             excel_buffer = BytesIO()
-            df.to_excel(excel_buffer, index=False, engine='openpyxl')
+            workbook = xlsxwriter.Workbook(excel_buffer, {
+                'constant_memory': True,
+                'strings_to_formulas': False,
+                'strings_to_urls': False
+            })
+            worksheet = workbook.add_worksheet()
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            worksheet.write_row(0, 0, fieldnames, header_format)
+            for row_index, row in enumerate(rows, 1):
+                worksheet.write_row(row_index, 0, [row.get(name) for name in fieldnames])
+            workbook.close()
             
             return excel_buffer.getvalue()
             
         except Exception as e:
-            self.log_event(f"Error generating Excel: {str(e)}", "error")
-            return None
\ No newline at end of file
+            self.log_event(f"Error generating Excel: {str(e)}", level="error")
+            return None
@@ -1,10 +1,9 @@
 import streamlit as st
+import collections
 from datetime import datetime, timedelta
-from utils.content_extractor import load_source_sites, find_ai_articles, extract_full_content
-from utils.ai_analyzer import summarize_article
-from utils.report_tools import generate_pdf_report, generate_csv_report, generate_excel_report
+from utils.content_extractor import load_source_sites, find_ai_articles, fetch_full_contents
+from utils.ai_analyzer import summarize_articles_batch
 from utils.simple_particles import add_simple_particles
-import pandas as pd
 import json
 import os
 from io import BytesIO
@@ -13,6 +12,11 @@ from openai import OpenAI
 from urllib.parse import quote
 import logging
 import gc
+import math
+import time
+import hashlib
+import re
+from html import escape
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -20,13 +24,45 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Articles shown per results page
+ARTICLES_PER_PAGE = 20
+
+# Takeaway cleanup patterns, compiled once for clean_takeaway
+_NUM_ALPHA_RE = re.compile(r'(\d+)([a-zA-Z])')
+_ALPHA_NUM_RE = re.compile(r'([a-zA-Z])(\d)')
+_DOLLAR_RE = re.compile(r'\$ *(\d+)')
+_DOLLAR_DECIMAL_RE = re.compile(r'\$ *(\d+) *\. *(\d+)')
+_THOUSANDS_RE = re.compile(r'(\d+) +(\d{3})')
+_SPACED_COMMA_RE = re.compile(r'(\d+) *\, *(\d+)')
+_SPACED_DECIMAL_RE = re.compile(r'(\d+) *\. *(\d+)')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' +([.,!?:;])')
+_NUMERIC_WORD_RE = re.compile(r'^[\d.,]+$')
+
+# Custom CSS to ensure proper text wrapping in the takeaway boxes
+_TAKEAWAY_STYLE = """
+<style>
+.takeaway-box {
+    background-color: #1E2530;
+    border-radius: 5px;
+    padding: 15px;
+    margin: 10px 0;
+    color: #FFFFFF;
+    word-wrap: break-word;
+    white-space: normal;
+    max-width: 100%;
+    overflow-wrap: break-word;
+    line-height: 1.5;
+}
+</style>
+"""
+
 # Initialize session state before anything else
 if 'initialized' not in st.session_state:
     try:
         logger.info("Initializing session state")
         st.session_state.articles = []
         st.session_state.selected_articles = []
-        st.session_state.scan_status = []
+        st.session_state.scan_status = collections.deque(maxlen=500)  # Newest first, bounded
         st.session_state.test_mode = False
         st.session_state.processing_time = None
         st.session_state.processed_urls = set()  # Track processed URLs
@@ -52,41 +88,87 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# We're using the utils/report_tools.py version instead
-from utils.report_tools import generate_pdf_report
+# (epoch second, formatted time) of the last status message, so messages
+# logged within the same second reuse one strftime
+_ts_cache = [0, ""]
 
-# We're using the utils/report_tools.py versions instead
-from utils.report_tools import generate_csv_report, generate_excel_report
 
 def update_status(message):
     """Updates the processing status in the Streamlit UI."""
-    current_time = datetime.now().strftime("%H:%M:%S")
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, time.strftime("%H:%M:%S", time.localtime(now))]
+    current_time = _ts_cache[1]
     status_msg = f"[{current_time}] {message}"
-    st.session_state.scan_status.insert(0, status_msg)
-
-
-
-def process_article(article, source, cutoff_time, db, seen_urls):
-    """Process a single article with optimized content extraction and analysis"""
-    if article['url'] in seen_urls:
-        return None
-        
+    st.session_state.scan_status.appendleft(status_msg)
+
+
+
+def _break_long_words(text):
+    """
+    Collapse whitespace to single spaces and break words over 25 characters
+    into 20-character pieces. Long words are replaced in place in the word
+    list, so only they are rebuilt.
+    """
+    words = text.split()
+    for i, word in enumerate(words):
+        # Don't break numbers or standard patterns
+        if len(word) > 25 and not _NUMERIC_WORD_RE.match(word):
+            words[i] = " ".join([word[j:j+20] for j in range(0, len(word), 20)])
+    return " ".join(words)
+
+def clean_takeaway(text):
+    """Clean and format takeaway text for display"""
+    # First, join any stray numbers and letters without adding extra spaces
+    text = _NUM_ALPHA_RE.sub(r'\1 \2', text)  # Add space between numbers and letters
+    text = _ALPHA_NUM_RE.sub(r'\1 \2', text)  # Add space between letters and numbers
+
+    # Fix dollar amounts with spaces
+    text = _DOLLAR_RE.sub(r'$\1', text)  # Remove space after $ sign
+    text = _DOLLAR_DECIMAL_RE.sub(r'$\1.\2', text)  # Fix spaced decimal in dollar amounts
+
+    # Fix numbers with spaces between digits
+    text = _THOUSANDS_RE.sub(r'\1,\2', text)  # Convert "200 000" to "200,000"
+    text = _SPACED_COMMA_RE.sub(r'\1,\2', text)  # Fix spaced commas
+    text = _SPACED_DECIMAL_RE.sub(r'\1.\2', text)  # Fix spaced decimals
+
+    # Fix trailing spaces before punctuation
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # Remove space before punctuation
+
+    # Fix long run-on words without adding spaces within numbers
+    result = _break_long_words(text)
+
+    # Final cleanup pass for any remaining issues
+    result = _THOUSANDS_RE.sub(r'\1,\2', result)  # Second pass for larger numbers
+    result = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', result)  # Final check for spaces before punctuation
+
+    return result
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def cached_source_sites(test_mode):
+    """load_source_sites, cached so repeated scans don't re-read the sites file"""
+    return load_source_sites(test_mode=test_mode)
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def build_reports(articles_key, _articles):
+    """
+    Generate the PDF, CSV and Excel reports. Cached by articles_key, a hash of
+    the articles, so a scan that finds the same articles reuses the reports.
+    """
+    # Imported here so ReportLab and openpyxl only load once reports are needed
+    from utils.report_tools import generate_pdf_report, generate_csv_report, generate_excel_report
+
+    # The reports are independent, so build them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pdf_future = executor.submit(generate_pdf_report, _articles)
+        csv_future = executor.submit(generate_csv_report, _articles)
+        excel_future = executor.submit(generate_excel_report, _articles)
+    return pdf_future.result(), csv_future.result(), excel_future.result()
+
+def process_article(article, source, analysis):
+    """Build the record for an article from its takeaway analysis"""
     try:
-        # Extract full content with caching
-        content = extract_full_content(article['url'])
-        if not content:
-            logger.warning(f"No content extracted from {article['url']}")
-            return None
-            
-        # Generate article takeaway with caching
-        try:
-            analysis = summarize_article(content)
-        except Exception as e:
-            logger.warning(f"Takeaway generation failed for {article['title']}: {e}")
-            analysis = {'takeaway': 'No takeaway available', 'key_points': []}
-
-        # Create article data
-        article_data = {
+        return {
             'title': article['title'],
             'url': article['url'],
             'date': article['date'],
@@ -95,84 +177,89 @@ def process_article(article, source, cutoff_time, db, seen_urls):
             'ai_validation': "AI-related article found in scan"
         }
         
-        # Save to database if possible
-        try:
-            db.save_article(article_data)
-        except Exception as e:
-            logger.error(f"Failed to save article to database: {e}")
-        
-        return article_data
-        
     except Exception as e:
         logger.error(f"Error processing article {article['url']}: {str(e)}")
         return None
         
+def scan_source(source, cutoff_time):
+    """Find a source's AI articles. Runs on a worker thread, so it must not touch st.session_state"""
+    try:
+        ai_articles = find_ai_articles(source, cutoff_time)
+        # Handle tuple return format if present
+        if isinstance(ai_articles, tuple):
+            ai_articles = ai_articles[0]
+        return ai_articles
+    except Exception as e:
+        logger.error(f"Error finding articles from {source}: {e}")
+        return []
+
+def process_source_articles(source, ai_articles, seen_urls):
+    """Fetch and summarize a source's new articles, returning the ones added"""
+    pending = [article for article in ai_articles if article['url'] not in seen_urls]
+
+    # Fetching is I/O-bound, so extract all contents concurrently first
+    contents = fetch_full_contents([article['url'] for article in pending])
+    fetched = []
+    for article, content in zip(pending, contents):
+        if content:
+            fetched.append((article, content))
+        else:
+            logger.warning(f"No content extracted from {article['url']}")
+
+    # Then summarize them together, several articles per API request
+    try:
+        analyses = summarize_articles_batch([content for _, content in fetched])
+    except Exception as e:
+        logger.warning(f"Takeaway generation failed for {source}: {e}")
+        analyses = [{'takeaway': 'No takeaway available', 'key_points': []}] * len(fetched)
+
+    processed_articles = []
+    for (article, _), analysis in zip(fetched, analyses):
+        article_data = process_article(article, source, analysis)
+        if article_data:
+            processed_articles.append(article_data)
+            seen_urls.add(article_data['url'])
+            update_status(f"Added: {article_data['title']}")
+    return processed_articles
+
 def process_batch(sources, cutoff_time, db, seen_urls, status_placeholder):
-    """Process a batch of sources with parallel article handling and caching"""
+    """Process a batch of sources, scanning them concurrently"""
     batch_articles = []
     total_article_count = 0
 
-    # Process each source in the batch
+    # Skip already processed sources
+    sources = [source for source in sources if source not in st.session_state.processed_urls]
     for source in sources:
-        try:
-            # Skip already processed sources
-            if source in st.session_state.processed_urls:
-                continue
+        update_status(f"Scanning: {source}")
+
+    # Scan all sources at once, so a slow source does not hold up the others;
+    # each source's articles are processed here as soon as its scan finishes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        future_to_source = {executor.submit(scan_source, source, cutoff_time): source for source in sources}
+        for future in as_completed(future_to_source):
+            source = future_to_source[future]
+            try:
+                ai_articles = future.result()
 
-            # Update status
-            current_time = datetime.now().strftime("%H:%M:%S")
-            update_status(f"Scanning: {source}")
+                # Update status if articles found
+                if ai_articles:
+                    update_status(f"Found {len(ai_articles)} AI articles from {source}")
+                    total_article_count += len(ai_articles)
+                    batch_articles.extend(process_source_articles(source, ai_articles, seen_urls))
+
+                # Mark source as processed
+                st.session_state.processed_urls.add(source)
 
-            # Find AI articles with caching and parallel processing
-            try:
-                ai_articles = find_ai_articles(source, cutoff_time)
-                # Handle tuple return format if present
-                if isinstance(ai_articles, tuple):
-                    ai_articles = ai_articles[0]
             except Exception as e:
-                logger.error(f"Error finding articles from {source}: {e}")
-                ai_articles = []
-
-            # Update status if articles found
-            if ai_articles:
-                update_status(f"Found {len(ai_articles)} AI articles from {source}")
-                total_article_count += len(ai_articles)
-                
-                # Process articles in parallel when there are multiple
-                processed_articles = []
-                if len(ai_articles) > 3:
-                    with ThreadPoolExecutor(max_workers=3) as executor:
-                        # Submit all articles for processing
-                        future_to_article = {
-                            executor.submit(process_article, article, source, cutoff_time, db, seen_urls): article 
-                            for article in ai_articles if article['url'] not in seen_urls
-                        }
-                        
-                        # Process results as they complete
-                        for future in as_completed(future_to_article):
-                            article_data = future.result()
-                            if article_data:
-                                processed_articles.append(article_data)
-                                seen_urls.add(article_data['url'])
-                                update_status(f"Added: {article_data['title']}")
-                else:
-                    # Process sequentially for small numbers of articles
-                    for article in ai_articles:
-                        article_data = process_article(article, source, cutoff_time, db, seen_urls)
-                        if article_data:
-                            processed_articles.append(article_data) 
-                            seen_urls.add(article_data['url'])
-                            update_status(f"Added: {article_data['title']}")
-                
-                # Add successful articles to batch
-                batch_articles.extend(processed_articles)
-                
-            # Mark source as processed
-            st.session_state.processed_urls.add(source)
+                logger.error(f"Error processing source {source}: {str(e)}")
+                continue
 
+    # Save the whole batch to the database in one transaction, if possible
+    if batch_articles:
+        try:
+            db.save_articles(batch_articles)
         except Exception as e:
-            logger.error(f"Error processing source {source}: {str(e)}")
-            continue
+            logger.error(f"Failed to save articles to database: {e}")
 
     logger.info(f"Processed {len(sources)} sources, found {total_article_count} articles, added {len(batch_articles)} articles")
     return batch_articles
@@ -217,10 +304,14 @@ def main():
             st.session_state.articles = []
 
         if fetch_button or st.session_state.is_fetching:
+            # Move everything already loaded (modules, session state) out of
+            # the collector's reach, so GC passes during the scan only walk
+            # objects the scan creates
+            gc.freeze()
             try:
                 start_time = datetime.now()
 
-                sources = load_source_sites(test_mode=st.session_state.test_mode)
+                sources = cached_source_sites(st.session_state.test_mode)
                 from utils.db_manager import DBManager
                 from urllib.parse import urlparse
                 db = DBManager()
@@ -231,29 +322,29 @@ def main():
                 batch_size = 5
                 total_batches = (len(sources) + batch_size - 1) // batch_size
 
+                # Calculate cutoff time based on selected unit, once, so every
+                # batch filters against the same cutoff
+                if time_unit == "Weeks":
+                    days_to_subtract = time_value * 7
+                else:  # Days
+                    days_to_subtract = time_value
+
+                cutoff_time = datetime.now() - timedelta(days=days_to_subtract)
+                logger.info(f"Time period: {time_value} {time_unit}, Cutoff: {cutoff_time}")
+
                 for batch_idx in range(total_batches):
                     start_idx = batch_idx * batch_size
                     end_idx = min(start_idx + batch_size, len(sources))
                     current_batch = sources[start_idx:end_idx]
 
-                    # Calculate cutoff time based on selected unit
-                    if time_unit == "Weeks":
-                        days_to_subtract = time_value * 7
-                    else:  # Days
-                        days_to_subtract = time_value
-
-                    cutoff_time = datetime.now() - timedelta(days=days_to_subtract)
-                    logger.info(f"Time period: {time_value} {time_unit}, Cutoff: {cutoff_time}")
-
-                    # Process current batch
-                    for source in current_batch:
-                        domain = urlparse(source).netloc or source
-                        with st.spinner(f"Researching {domain}..."):
-                            batch_articles = process_batch([source], cutoff_time, db, seen_urls, status_placeholder)
+                    # Process current batch, all of its sources together
+                    domains = ", ".join(urlparse(source).netloc or source for source in current_batch)
+                    with st.spinner(f"Researching {domains}..."):
+                        batch_articles = process_batch(current_batch, cutoff_time, db, seen_urls, status_placeholder)
 
-                        # Add articles to session state if found
-                        if batch_articles:
-                            st.session_state.articles.extend(batch_articles)
+                    # Add articles to session state if found
+                    if batch_articles:
+                        st.session_state.articles.extend(batch_articles)
 
                     # Update progress
                     progress = (batch_idx + 1) / total_batches
@@ -263,14 +354,19 @@ def main():
                 st.session_state.is_fetching = False
                 st.session_state.scan_complete = True
 
-                # Store the current articles for persistent access
-                st.session_state.current_articles = st.session_state.articles.copy()
+                # Store the current articles for persistent access. A new scan
+                # rebinds st.session_state.articles to a fresh list, so this one
+                # can be shared rather than copied
+                st.session_state.current_articles = st.session_state.articles
 
                 # Generate reports and store them in session state
                 if st.session_state.articles:
-                    st.session_state.pdf_data = generate_pdf_report(st.session_state.current_articles)
-                    st.session_state.csv_data = generate_csv_report(st.session_state.current_articles)
-                    st.session_state.excel_data = generate_excel_report(st.session_state.current_articles)
+                    articles_key = hashlib.sha256(
+                        json.dumps(st.session_state.current_articles, sort_keys=True, default=str).encode()
+                    ).hexdigest()
+                    (st.session_state.pdf_data,
+                     st.session_state.csv_data,
+                     st.session_state.excel_data) = build_reports(articles_key, st.session_state.current_articles)
 
                 # Show completion message and stats
                 end_time = datetime.now()
@@ -283,6 +379,8 @@ def main():
                 st.session_state.is_fetching = False
                 st.error(f"An error occurred: {str(e)}")
                 logger.error(f"Error in main process: {str(e)}")
+            finally:
+                gc.unfreeze()
 
         # Always display results if we have them (either from current scan or previous one)
         if st.session_state.scan_complete and st.session_state.current_articles:
@@ -334,78 +432,28 @@ def main():
                             key="excel_download"  # Unique key to avoid conflicts
                         )
 
-                # Show articles
+                # Show articles: the style goes out once, and the articles as a
+                # single HTML block rather than several elements per article
                 st.markdown("### Found AI Articles")
-                for article in st.session_state.current_articles:
-                    st.markdown("---")
-                    st.markdown(f"### [{article['title']}]({article['url']})")
-                    st.markdown(f"Published: {article['date']}")
-                    # Get and process the takeaway text
-                    import re
-                    
-                    # Helper function to clean and format takeaway text
-                    def clean_takeaway(text):
-                        # First, join any stray numbers and letters without adding extra spaces
-                        text = re.sub(r'(\d+)([a-zA-Z])', r'\1 \2', text)  # Add space between numbers and letters
-                        text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', text)  # Add space between letters and numbers
-                        
-                        # Fix dollar amounts with spaces 
-                        text = re.sub(r'\$ *(\d+)', r'$\1', text)  # Remove space after $ sign
-                        text = re.sub(r'\$ *(\d+) *\. *(\d+)', r'$\1.\2', text)  # Fix spaced decimal in dollar amounts
-                        
-                        # Fix numbers with spaces between digits
-                        text = re.sub(r'(\d+) +(\d{3})', r'\1,\2', text)  # Convert "200 000" to "200,000"
-                        text = re.sub(r'(\d+) *\, *(\d+)', r'\1,\2', text)  # Fix spaced commas
-                        text = re.sub(r'(\d+) *\. *(\d+)', r'\1.\2', text)  # Fix spaced decimals
-                        
-                        # Fix trailing spaces before punctuation
-                        text = re.sub(r' +([.,!?:;])', r'\1', text)  # Remove space before punctuation
-                        
-                        # Fix long run-on words without adding spaces within numbers
-                        words = text.split()
-                        processed_words = []
-                        for word in words:
-                            # Don't break numbers or standard patterns
-                            if len(word) > 25 and not re.match(r'^[\d.,]+$', word):
-                                # Only break very long words
-                                chunks = [word[i:i+20] for i in range(0, len(word), 20)]
-                                processed_words.append(" ".join(chunks))
-                            else:
-                                processed_words.append(word)
-                        
-                        result = " ".join(processed_words)
-                        
-                        # Final cleanup pass for any remaining issues
-                        result = re.sub(r'(\d+) +(\d{3})', r'\1,\2', result)  # Second pass for larger numbers
-                        result = re.sub(r' +([.,!?:;])', r'\1', result)  # Final check for spaces before punctuation
-                        
-                        return result
-                    
-                    takeaway_text = article.get('takeaway', 'No takeaway available')
-                    takeaway_text = clean_takeaway(takeaway_text)
-                    
-                    # Display the takeaway with custom formatting
-                    st.subheader("Takeaway")
-                    
-                    # Custom CSS to ensure proper text wrapping
-                    st.markdown("""
-                    <style>
-                    .takeaway-box {
-                        background-color: #1E2530;
-                        border-radius: 5px;
-                        padding: 15px;
-                        margin: 10px 0;
-                        color: #FFFFFF;
-                        word-wrap: break-word;
-                        white-space: normal;
-                        max-width: 100%;
-                        overflow-wrap: break-word;
-                        line-height: 1.5;
-                    }
-                    </style>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown(f'<div class="takeaway-box">{takeaway_text}</div>', unsafe_allow_html=True)
+                st.markdown(_TAKEAWAY_STYLE, unsafe_allow_html=True)
+                articles = st.session_state.current_articles
+                # Render one page of articles at a time so reruns stay fast on large scans
+                page_count = max(1, math.ceil(len(articles) / ARTICLES_PER_PAGE))
+                page = 1
+                if page_count > 1:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="articles_page")
+                page_articles = articles[(page - 1) * ARTICLES_PER_PAGE:page * ARTICLES_PER_PAGE]
+                takeaways = [clean_takeaway(article.get('takeaway', 'No takeaway available')) for article in page_articles]
+                html_parts = []
+                for article, takeaway_text in zip(page_articles, takeaways):
+                    html_parts.append(
+                        "<hr>"
+                        f"<h3><a href='{escape(article['url'])}'>{escape(article['title'])}</a></h3>"
+                        f"<p>Published: {escape(str(article['date']))}</p>"
+                        "<h3>Takeaway</h3>"
+                        f'<div class="takeaway-box">{escape(takeaway_text)}</div>'
+                    )
+                st.markdown("".join(html_parts), unsafe_allow_html=True)
         elif st.session_state.scan_complete and not st.session_state.current_articles:
             with results_section:
                 st.warning("No articles found. Please try adjusting the time period or check the source sites.")
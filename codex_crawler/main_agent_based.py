@@ -1,8 +1,9 @@
 import streamlit as st
+import collections
 from datetime import datetime
 import logging
+import math
 import os
-import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import the new agent-based components
@@ -10,6 +11,9 @@ from agents.orchestrator import Orchestrator
 from agents.base_agent import BaseAgent
 from utils.simple_particles import add_simple_particles
 
+# Articles shown per results page
+ARTICLES_PER_PAGE = 20
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,7 +24,7 @@ if 'initialized' not in st.session_state:
         logger.info("Initializing session state")
         st.session_state.articles = []
         st.session_state.selected_articles = []
-        st.session_state.scan_status = []
+        st.session_state.scan_status = collections.deque(maxlen=500)  # Newest first, bounded
         st.session_state.test_mode = False
         st.session_state.processing_time = None
         st.session_state.processed_urls = set()
@@ -67,7 +71,7 @@ def update_status(message):
     """Updates the processing status in the Streamlit UI."""
     current_time = datetime.now().strftime("%H:%M:%S")
     status_msg = f"[{current_time}] {message}"
-    st.session_state.scan_status.insert(0, status_msg)
+    st.session_state.scan_status.appendleft(status_msg)
 
 def main():
     try:
@@ -107,7 +111,7 @@ def main():
             st.session_state.excel_data = None
             st.session_state.scan_complete = False
             st.session_state.articles = []
-            st.session_state.scan_status = []
+            st.session_state.scan_status = collections.deque(maxlen=500)
 
         # Process articles using the agent-based architecture
         if fetch_button or st.session_state.is_fetching:
@@ -212,7 +216,14 @@ def main():
 
                 # Show articles
                 st.markdown("### Found AI Articles")
-                for article in st.session_state.current_articles:
+                articles = st.session_state.current_articles
+                # Render one page of articles at a time so reruns stay fast on large scans
+                page_count = max(1, math.ceil(len(articles) / ARTICLES_PER_PAGE))
+                page = 1
+                if page_count > 1:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="articles_page")
+                page_articles = articles[(page - 1) * ARTICLES_PER_PAGE:page * ARTICLES_PER_PAGE]
+                for article in page_articles:
                     st.markdown("---")
                     st.markdown(f"### [{article['title']}]({article['url']})")
                     st.markdown(f"Published: {article['date']}")
@@ -231,6 +242,7 @@ def main():
                     # Criteria dashboard
                     criteria = article.get('criteria_results', [])
                     if criteria:
+                        import pandas as pd  # Only needed for the criteria dashboard
                         crit_df = pd.DataFrame([
                             {
                                 'Criteria': c.get('criteria'),
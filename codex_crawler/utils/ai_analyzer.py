@@ -1,13 +1,23 @@
 
 import os
-from openai import OpenAI
-import json
+import asyncio
+from openai import OpenAI, AsyncOpenAI
+import orjson
 from typing import Dict, Any, Optional, List
 import re
 import logging
 import functools
-import hashlib
+import tempfile
+import threading
 import time
+from concurrent.futures import Future
+import tiktoken
+import xxhash
+
+try:
+    from diskcache import Cache as DiskCache  # Persistent cache shared across runs
+except ImportError:
+    DiskCache = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -15,158 +25,352 @@ logger = logging.getLogger(__name__)
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
-# Simple in-memory cache for API responses
-_cache = {}
+CACHE_DIR = os.environ.get('CRAWLER_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'codex_crawler_cache'))
+
+# How long cached chunk results and article summaries stay valid
+_CHUNK_CACHE_TTL = 6 * 3600
+_ARTICLE_CACHE_TTL = 24 * 3600
+
+# Futures for cache keys being computed right now, so concurrent callers
+# (other sessions' threads or other chunks in a gather) wait for the same
+# request instead of repeating it
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Takeaway rules shared by the single-article and batched prompts
+_TAKEAWAY_RULES = (
+    "1. Write EXACTLY 3-4 impactful sentences in a single paragraph (70-90 words total)\n" +
+    "2. ALWAYS include specific company names mentioned in the article\n" +
+    "3. MUST include REAL quantitative data when available ($16.6 billion, 200,000 users, 45% improvement)\n" +
+    "4. DO NOT fabricate or estimate statistics - use ONLY numbers from the source text\n" +
+    "5. Highlight measurable ROI, cost savings, revenue gains, or performance improvements\n" +
+    "6. Clearly explain HOW companies are using AI and the SPECIFIC strategic benefits\n" +
+    "7. Use clear, plain language without technical jargon\n" +
+    "8. Include strategic business implications that explain WHY this matters\n" +
+    "9. Format all numbers consistently with proper spacing and commas\n" +
+    "10. Stay professional - NO promotional language or generic claims\n\n"
+)
+
+# Precompiled patterns used when splitting content into chunks
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Structured Outputs formats: the API guarantees replies parse and match these
+# schemas, so the prompts need no JSON instructions
+_TAKEAWAY_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "takeaway",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"takeaway": {"type": "string"}},
+            "required": ["takeaway"],
+            "additionalProperties": False
+        }
+    }
+}
+_TAKEAWAYS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "takeaways",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "takeaways": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "idx": {"type": "integer"},
+                            "takeaway": {"type": "string"}
+                        },
+                        "required": ["idx", "takeaway"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["takeaways"],
+            "additionalProperties": False
+        }
+    }
+}
+
+_SYSTEM_PROMPT = "You write factual, business-focused takeaways about AI news for executives."
+
+# Limits on how many articles summarize_articles_batch packs into one request
+_BATCH_MAX_CHARS = 60000
+_BATCH_MAX_ARTICLES = 10
+
+# Most chunk requests one article has in flight at once
+_CHUNK_CONCURRENCY = 8
+
+class _Fallback(dict):
+    """Placeholder result standing in for a failed or unusable API call.
+    Never cached, so the article is retried on its next request."""
+
+def _key_bytes(arg) -> bytes:
+    """Bytes identifying one cached function argument"""
+    if isinstance(arg, str):
+        return arg.encode()
+    if isinstance(arg, list):
+        # Chunk summaries: only their takeaways feed the combined result
+        return "\0".join(
+            str(item.get("takeaway", "")) if isinstance(item, dict) else str(item)
+            for item in arg
+        ).encode()
+    return str(arg).encode()
+
+@functools.lru_cache(maxsize=1)
+def _get_cache():
+    """API response cache: a size-bounded disk store that survives restarts,
+    or an in-memory dict of (timestamp, result) without diskcache"""
+    if DiskCache is not None:
+        return DiskCache(os.path.join(CACHE_DIR, 'summaries'), size_limit=2 ** 30)
+    return {}
+
+def _cache_get(key: str, ttl: int):
+    """Cached result for key if younger than ttl seconds, else None"""
+    cache = _get_cache()
+    if isinstance(cache, dict):
+        entry = cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+        return None
+    return cache.get(key)  # diskcache drops entries once they expire
+
+def _cache_set(key: str, value, ttl: int):
+    """Cache value under key for ttl seconds"""
+    cache = _get_cache()
+    if isinstance(cache, dict):
+        cache[key] = (time.time(), value)
+    else:
+        cache.set(key, value, expire=ttl)
+
+def _claim_inflight(key: str):
+    """(future, owner) for key; only the owner computes, everyone else waits on the future"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = _inflight[key] = Future()
+        return future, True
+
+def _resolve_inflight(key: str, future: Future, result=None, error: Optional[BaseException] = None):
+    """Hand the owner's outcome to every caller waiting on key"""
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def _cache_key(name: str, args: tuple) -> str:
+    """Cache key for a call to the named function with these positional arguments"""
+    hasher = xxhash.xxh3_64()
+    for arg in args:
+        hasher.update(_key_bytes(arg))
+        hasher.update(b"\0")
+    return f"{name}:{hasher.hexdigest()}"
 
 def cache_result(func):
     """Cache decorator for expensive API calls"""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # Create a cache key based on function name and arguments
-        cache_key = f"{func.__name__}:{hashlib.md5(str(args).encode()).hexdigest()}"
+        cache_key = _cache_key(func.__name__, args)
         
         # If result exists in cache and is less than 6 hours old, return it
-        if cache_key in _cache:
-            timestamp, result = _cache[cache_key]
-            if time.time() - timestamp < 21600:  # 6 hours
-                logger.info(f"Using cached result for {func.__name__}")
-                return result
+        result = _cache_get(cache_key, _CHUNK_CACHE_TTL)
+        if result is not None:
+            logger.info(f"Using cached result for {func.__name__}")
+            return result
         
-        # Otherwise, call the function and cache the result
-        result = func(*args, **kwargs)
-        _cache[cache_key] = (time.time(), result)
+        # Otherwise wait for a caller already computing it, or compute and cache it
+        future, owner = _claim_inflight(cache_key)
+        if not owner:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+            if not isinstance(result, _Fallback):
+                _cache_set(cache_key, result, _CHUNK_CACHE_TTL)
+        except BaseException as e:
+            _resolve_inflight(cache_key, future, error=e)
+            raise
+        _resolve_inflight(cache_key, future, result)
         return result
     
     return wrapper
 
-def split_into_chunks(content: str, max_chunk_size: int = 40000) -> List[str]:
-    """Split content into smaller chunks to avoid processing issues."""
+def _sentence_spans(content: str):
+    """Yield (start, end) offsets of each sentence without building a list of them"""
+    start = 0
+    for match in _SENT_RE.finditer(content):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(content)
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Tokenizer for gpt-4o-mini, loaded on first use"""
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def split_into_chunks(content: str, max_chunk_size: int = 40000, normalize: bool = True) -> List[str]:
+    """Split content into chunks of at most max_chunk_size model tokens.
+    Pass normalize=False for content whose whitespace is already collapsed."""
     # Clean and normalize content - more efficient regex
-    content = re.sub(r'\s+', ' ', content.strip())
+    if normalize:
+        content = _WS_RE.sub(' ', content.strip())
 
-    # Quick return for small content
-    if len(content) < max_chunk_size * 3:  # ~3 chars per token
+    # Quick return for small content: a token is at least one UTF-8 byte
+    if len(content) * 4 <= max_chunk_size:
         return [content]
 
-    # Improved sentence splitting with better boundary handling
-    sentences = re.split(r'(?<=[.!?])\s+', content)
+    # Count tokens a sentence at a time and emit each chunk as one slice
+    # of the normalized text
+    encoding = _get_encoding()
     chunks = []
-    current_chunk = []
-    current_size = 0
-    char_per_token = 3  
-    max_chunk_chars = max_chunk_size * char_per_token
+    chunk_start = None
+    chunk_end = 0
+    current_tokens = 0
 
-    for sentence in sentences:
-        sentence_chars = len(sentence)
+    for start, end in _sentence_spans(content):
+        sentence_tokens = encoding.encode_ordinary(content[start:end])
+        sentence_size = len(sentence_tokens)
 
-        # Handle very long sentences more efficiently
-        if sentence_chars > max_chunk_chars:
-            logger.warning(f"Very long sentence ({sentence_chars} chars) will be truncated")
+        # Split very long sentences on token boundaries
+        if sentence_size > max_chunk_size:
+            logger.warning(f"Very long sentence ({sentence_size} tokens) will be split")
             # Append existing chunk if any
-            if current_chunk:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = []
-                current_size = 0
-            
-            # Create chunks from the long sentence
-            for i in range(0, len(sentence), max_chunk_chars):
-                chunks.append(sentence[i:i+max_chunk_chars])
+            if chunk_start is not None:
+                chunks.append(content[chunk_start:chunk_end])
+                chunk_start = None
+                current_tokens = 0
+
+            for i in range(0, sentence_size, max_chunk_size):
+                chunks.append(encoding.decode(sentence_tokens[i:i + max_chunk_size]))
             continue
 
         # Start a new chunk if the current one would exceed the limit
-        if current_size + sentence_chars > max_chunk_chars:
-            chunks.append(' '.join(current_chunk))
-            current_chunk = [sentence]
-            current_size = sentence_chars
-        else:
-            current_chunk.append(sentence)
-            current_size += sentence_chars
+        if current_tokens + sentence_size > max_chunk_size:
+            chunks.append(content[chunk_start:chunk_end])
+            chunk_start = None
+            current_tokens = 0
+
+        if chunk_start is None:
+            chunk_start = start
+        chunk_end = end
+        current_tokens += sentence_size
 
     # Don't forget the last chunk
-    if current_chunk:
-        chunks.append(' '.join(current_chunk))
+    if chunk_start is not None:
+        chunks.append(content[chunk_start:chunk_end])
 
-    logger.info(f"Split content into {len(chunks)} chunks (max size: {max_chunk_size} tokens)")
+    if len(chunks) > 1:
+        logger.info(f"Split content into {len(chunks)} chunks (max size: {max_chunk_size} tokens)")
     return chunks
 
+def _chunk_request(chunk: str) -> Dict[str, Any]:
+    """Completion arguments for summarizing a single chunk"""
+    prompt = (
+        "Analyze this text and create a business-focused takeaway following these STRICT RULES:\n\n" +
+        _TAKEAWAY_RULES +
+        chunk
+    )
+
+    return dict(
+        model="gpt-4o-mini",  # Using gpt-4o-mini for better balance of speed and quality
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        max_completion_tokens=2000,
+        response_format=_TAKEAWAY_FORMAT,
+        timeout=30
+    )
+
+def _parse_chunk_response(response) -> Dict[str, Any]:
+    """Takeaway from a chunk completion"""
+    if not response or not response.choices or not response.choices[0].message:
+        logger.warning("Empty response received from API")
+        return _Fallback(takeaway="Error: Empty response from AI")
+        
+    content = response.choices[0].message.content
+    if content:
+        try:
+            # orjson skips surrounding whitespace itself, so no strip() copy
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as json_err:
+            # Only a reply cut off at the token limit fails to parse
+            logger.warning(f"JSON decode error: {json_err} - Content: {content[:100]}...")
+
+    return _Fallback(takeaway="Error extracting content.")
+
 @cache_result
 def _process_chunk(chunk: str) -> Optional[Dict[str, Any]]:
     """Process a single chunk of content with caching to avoid redundant API calls."""
     try:
-        # Limit chunk size to avoid excessive token usage
-        if len(chunk) > 150000:
-            logger.warning(f"Chunk too large ({len(chunk)} chars), truncating...")
-            chunk = chunk[:150000] + "..."
-
-        prompt = (
-            "Analyze this text and create a business-focused takeaway following these STRICT RULES:\n\n" +
-            "1. Write EXACTLY 3-4 impactful sentences in a single paragraph (70-90 words total)\n" +
-            "2. ALWAYS include specific company names mentioned in the article\n" +
-            "3. MUST include REAL quantitative data when available ($16.6 billion, 200,000 users, 45% improvement)\n" +
-            "4. DO NOT fabricate or estimate statistics - use ONLY numbers from the source text\n" +
-            "5. Highlight measurable ROI, cost savings, revenue gains, or performance improvements\n" +
-            "6. Clearly explain HOW companies are using AI and the SPECIFIC strategic benefits\n" +
-            "7. Use clear, plain language without technical jargon\n" +
-            "8. Include strategic business implications that explain WHY this matters\n" +
-            "9. Format all numbers consistently with proper spacing and commas\n" +
-            "10. Stay professional - NO promotional language or generic claims\n\n" +
-            "Respond with valid JSON only: {\"takeaway\": \"Your concise takeaway here\"}\n" +
-            "Ensure your JSON has properly closed quotes and braces.\n\n" + 
-            chunk
-        )
-
         try:
             # Use an explicit model with timeout and retry mechanism
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",  # Using gpt-4o-mini for better balance of speed and quality
-                messages=[
-                    {"role": "system", "content": "You are a JSON generator. You must return ONLY valid, complete JSON in format {\"takeaway\": \"text\"}. Ensure all quotes are properly escaped and closed."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=2000,
-                response_format={"type": "json_object"},
-                timeout=30
-            )
+            response = client.chat.completions.create(**_chunk_request(chunk))
         except Exception as api_error:
             logger.error(f"API error during processing: {str(api_error)}")
             # Return placeholder on API error to avoid cascading failures
-            return {"takeaway": "Unable to process content due to API limitations."}
+            return _Fallback(takeaway="Unable to process content due to API limitations.")
 
-        if not response or not response.choices or not response.choices[0].message:
-            logger.warning("Empty response received from API")
-            return {"takeaway": "Error: Empty response from AI"}
-            
-        content = response.choices[0].message.content
-        if content:
-            content = content.strip()
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError as json_err:
-                logger.warning(f"JSON decode error: {json_err} - Content: {content[:100]}...")
-                
-                # Progressive fallback for malformed JSON
-                # First try a more precise pattern for quoted takeaway
-                takeaway_match = re.search(r'"takeaway"\s*:\s*"((?:[^"\\]|\\.)*)(?:"|\Z)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
-                    
-                # Try an alternate pattern that just gets everything between the quotes
-                takeaway_match = re.search(r'"takeaway"\s*:\s*"([^"]*)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
-                    
-                # As a last resort, just try to extract any text after the takeaway key
-                takeaway_match = re.search(r'"takeaway"\s*:\s*["\']?([^"}\']+)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
-                    
-        return {"takeaway": "Error extracting content."}
+        return _parse_chunk_response(response)
 
     except Exception as e:
         logger.error(f"Error processing chunk: {str(e)}")
-        return {
-            "takeaway": "Error occurred during content processing."
-        }
+        return _Fallback(takeaway="Error occurred during content processing.")
+
+async def _arequest_chunk(aclient: AsyncOpenAI, chunk: str, limit: asyncio.Semaphore) -> Dict[str, Any]:
+    """Summarize one chunk over the async client; a _Fallback on failure"""
+    try:
+        try:
+            async with limit:
+                response = await aclient.chat.completions.create(**_chunk_request(chunk))
+        except Exception as api_error:
+            logger.error(f"API error during processing: {str(api_error)}")
+            return _Fallback(takeaway="Unable to process content due to API limitations.")
+
+        return _parse_chunk_response(response)
+
+    except Exception as e:
+        logger.error(f"Error processing chunk: {str(e)}")
+        return _Fallback(takeaway="Error occurred during content processing.")
+
+async def _aprocess_chunk(aclient: AsyncOpenAI, chunk: str, limit: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+    """Async counterpart of _process_chunk, sharing its cache"""
+    cache_key = _cache_key("_process_chunk", (chunk,))
+    result = _cache_get(cache_key, _CHUNK_CACHE_TTL)
+    if result is not None:
+        logger.info("Using cached result for _process_chunk")
+        return result
+
+    future, owner = _claim_inflight(cache_key)
+    if not owner:
+        return await asyncio.wrap_future(future)
+    try:
+        result = await _arequest_chunk(aclient, chunk, limit)
+        if not isinstance(result, _Fallback):
+            _cache_set(cache_key, result, _CHUNK_CACHE_TTL)
+    except BaseException as e:
+        # Cancelled, or the cache write failed: release anyone waiting on this chunk
+        _resolve_inflight(cache_key, future, error=e)
+        raise
+    _resolve_inflight(cache_key, future, result)
+    return result
+
+async def _aprocess_chunks(chunks: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Summarize all chunks concurrently over one client, a bounded number at a time"""
+    limit = asyncio.Semaphore(_CHUNK_CONCURRENCY)
+    async with AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY')) as aclient:
+        return await asyncio.gather(*(_aprocess_chunk(aclient, chunk, limit) for chunk in chunks))
 
 @cache_result
 def _combine_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -202,7 +406,6 @@ def _combine_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
             "8. Use plain, accessible language that executives can understand\n" +
             "9. Focus on strategic business impact and competitive advantage\n" +
             "10. Maintain professional tone - NO promotional language or vague claims\n\n" +
-            "Respond in JSON format: {\"takeaway\": \"combined takeaway\"}\n\n" +
             f"Takeaways to combine: {combined_text[:50000]}"  # Limit text size
         )
 
@@ -211,57 +414,45 @@ def _combine_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
             response = client.chat.completions.create(
                 model="gpt-4o-mini",  # Using gpt-4o-mini for balance of speed and quality
                 messages=[
-                    {"role": "system", "content": "You are a JSON generator. You must return ONLY valid, complete JSON in format {\"takeaway\": \"text\"}. Ensure all quotes are properly escaped and closed."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_completion_tokens=2000,
-                response_format={"type": "json_object"},
+                response_format=_TAKEAWAY_FORMAT,
                 timeout=30
             )
         except Exception as api_error:
             logger.error(f"API error during summary combination: {str(api_error)}")
             # Return the first summary as fallback on API error
             if summaries and "takeaway" in summaries[0]:
-                return summaries[0]
-            return {"takeaway": "Unable to combine summaries due to API limitations."}
+                return _Fallback(summaries[0])
+            return _Fallback(takeaway="Unable to combine summaries due to API limitations.")
 
         if not response or not response.choices or not response.choices[0].message:
             logger.warning("Empty response received from API during combination")
-            return {"takeaway": "Error: Empty response from AI"}
+            return _Fallback(takeaway="Error: Empty response from AI")
             
         content = response.choices[0].message.content
         if content:
-            content = content.strip()
             try:
-                return json.loads(content)
-            except json.JSONDecodeError as json_err:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError as json_err:
                 logger.warning(f"JSON decode error in combine: {json_err} - Content: {content[:100]}...")
-                
-                # Progressive fallback with better patterns
-                # First try a more precise pattern for quoted takeaway
-                takeaway_match = re.search(r'"takeaway"\s*:\s*"((?:[^"\\]|\\.)*)(?:"|\Z)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
-                    
-                # Try an alternate pattern that just gets everything between the quotes
-                takeaway_match = re.search(r'"takeaway"\s*:\s*"([^"]*)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
-                    
-                # As a last resort, just try to extract any text after the takeaway key
-                takeaway_match = re.search(r'"takeaway"\s*:\s*["\']?([^"}\']+)', content)
-                if takeaway_match:
-                    return {"takeaway": takeaway_match.group(1)}
         
         # If we get here, use the combined text as fallback (combined_text is always initialized above)
-        return {"takeaway": combined_text[:2000] if combined_text else "Error processing content"}
+        return _Fallback(takeaway=combined_text[:2000] if combined_text else "Error processing content")
 
     except Exception as e:
         logger.error(f"Error combining summaries: {str(e)}")
         # Return a meaningful fallback even in case of errors
         if summaries and len(summaries) > 0 and "takeaway" in summaries[0]:
-            return summaries[0]  # Return the first summary if available
-        return {"takeaway": "Error processing content"}
+            return _Fallback(summaries[0])  # Return the first summary if available
+        return _Fallback(takeaway="Error processing content")
+
+def _article_cache_key(content: str) -> str:
+    """Cache key for an article's summary, from its normalized content"""
+    content_hash = xxhash.xxh3_64_hexdigest(content[:10000].encode())
+    return f"article_summary:{content_hash}"
 
 def summarize_article(content: str) -> Dict[str, Any]:
     """Generate a takeaway for an article with improved efficiency and error handling."""
@@ -273,22 +464,19 @@ def summarize_article(content: str) -> Dict[str, Any]:
             }
 
         # Normalize content to improve processing
-        content = re.sub(r'\s+', ' ', content.strip())
+        content = _WS_RE.sub(' ', content.strip())
         
         # Generate a unique identifier for the article content for caching
-        content_hash = hashlib.md5(content[:10000].encode()).hexdigest()
-        cache_key = f"article_summary:{content_hash}"
+        cache_key = _article_cache_key(content)
         
         # Check if we already have this article cached
-        if cache_key in _cache:
-            timestamp, result = _cache[cache_key]
-            # Use cache if less than 24 hours old
-            if time.time() - timestamp < 86400:  # 24 hours in seconds
-                logger.info(f"Using cached article summary")
-                return result
+        result = _cache_get(cache_key, _ARTICLE_CACHE_TTL)
+        if result is not None:
+            logger.info(f"Using cached article summary")
+            return result
         
         # Split content into manageable chunks
-        chunks = split_into_chunks(content, max_chunk_size=40000)
+        chunks = split_into_chunks(content, max_chunk_size=40000, normalize=False)
 
         if not chunks:
             return {
@@ -296,20 +484,11 @@ def summarize_article(content: str) -> Dict[str, Any]:
             }
 
         # Process chunks in parallel if there are multiple chunks
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks):
-            chunk_tokens = len(chunk) // 3
-            logger.info(f"Processing chunk {i+1}/{len(chunks)} (~{chunk_tokens} tokens)")
-
-            if chunk_tokens > 40000:
-                logger.warning(f"Chunk {i+1} too large ({chunk_tokens} tokens), truncating")
-                truncated_chunk = chunk[:120000]
-                summary = _process_chunk(truncated_chunk)
-            else:
-                summary = _process_chunk(chunk)
-
-            if summary:
-                chunk_summaries.append(summary)
+        if len(chunks) == 1:
+            summaries = [_process_chunk(chunks[0])]
+        else:
+            summaries = asyncio.run(_aprocess_chunks(chunks))
+        chunk_summaries = [summary for summary in summaries if summary]
 
         if not chunk_summaries:
             return {
@@ -318,12 +497,11 @@ def summarize_article(content: str) -> Dict[str, Any]:
 
         # Combine summaries - already uses caching via the decorator
         combined = _combine_summaries(chunk_summaries)
-        result = combined if combined else {
-            "takeaway": "Error combining article summaries."
-        }
+        result = combined if combined else _Fallback(takeaway="Error combining article summaries.")
         
-        # Cache the final result
-        _cache[cache_key] = (time.time(), result)
+        # Cache the final result, unless any part of it stands in for a failed call
+        if not any(isinstance(summary, _Fallback) for summary in [result, *chunk_summaries]):
+            _cache_set(cache_key, result, _ARTICLE_CACHE_TTL)
         
         return result
 
@@ -332,3 +510,97 @@ def summarize_article(content: str) -> Dict[str, Any]:
         return {
             "takeaway": "Unable to analyze content at this time."
         }
+
+def _process_article_group(contents: List[str]) -> List[Optional[str]]:
+    """Summarize several articles in one API call; None for any article missing from the response."""
+    takeaways = [None] * len(contents)
+    articles_text = "".join(
+        f"<<ARTICLE {number}>>\n{content}\n<<END {number}>>\n\n"
+        for number, content in enumerate(contents, 1)
+    )
+    prompt = (
+        "Analyze each numbered article below and create a separate business-focused takeaway " +
+        "for every article following these STRICT RULES:\n\n" +
+        _TAKEAWAY_RULES +
+        "Give one takeaway per article, with idx set to the article's number.\n\n" +
+        articles_text
+    )
+
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_completion_tokens=max(2000, 400 * len(contents)),
+            response_format=_TAKEAWAYS_FORMAT,
+            timeout=60
+        )
+    except Exception as api_error:
+        logger.error(f"API error during batch summarization: {str(api_error)}")
+        return takeaways
+
+    if not response or not response.choices or not response.choices[0].message:
+        logger.warning("Empty response received from API during batch summarization")
+        return takeaways
+
+    content = response.choices[0].message.content
+    try:
+        for entry in orjson.loads(content or "{}").get("takeaways", []):
+            idx = int(entry.get("idx", 0))
+            takeaway = entry.get("takeaway")
+            if 1 <= idx <= len(contents) and isinstance(takeaway, str) and takeaway:
+                takeaways[idx - 1] = takeaway
+    except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+        logger.warning(f"Could not parse batch summarization response: {e}")
+
+    return takeaways
+
+def summarize_articles_batch(contents: List[str]) -> List[Dict[str, Any]]:
+    """
+    Generate takeaways for many articles, packing several into each API call.
+    Results line up with contents. Articles too long to share a call, or left
+    out of the model's response, are summarized on their own.
+    """
+    results = [None] * len(contents)
+    pending = []
+    for i, content in enumerate(contents):
+        if not content or len(content) < 100:
+            results[i] = {"takeaway": "Article content is too short or empty."}
+            continue
+
+        content = _WS_RE.sub(' ', content.strip())
+        cache_key = _article_cache_key(content)
+        result = _cache_get(cache_key, _ARTICLE_CACHE_TTL)
+        if result is not None:
+            results[i] = result
+            continue
+
+        if len(content) > _BATCH_MAX_CHARS:
+            results[i] = summarize_article(content)
+        else:
+            pending.append((i, content, cache_key))
+
+    # Group the remaining articles into calls under the size limits
+    groups = []
+    group_size = 0
+    for item in pending:
+        if not groups or group_size + len(item[1]) > _BATCH_MAX_CHARS or len(groups[-1]) >= _BATCH_MAX_ARTICLES:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(item)
+        group_size += len(item[1])
+
+    for group in groups:
+        logger.info(f"Summarizing {len(group)} articles in one request")
+        takeaways = _process_article_group([content for _, content, _ in group])
+        for (i, content, cache_key), takeaway in zip(group, takeaways):
+            if takeaway:
+                result = {"takeaway": takeaway}
+                _cache_set(cache_key, result, _ARTICLE_CACHE_TTL)
+            else:
+                result = summarize_article(content)
+            results[i] = result
+
+    return results
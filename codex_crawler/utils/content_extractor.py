@@ -1,14 +1,16 @@
 # Importing ThreadPoolExecutor inside process_batch to fix the scope issue.
+import asyncio
+import httpx
 import trafilatura
 import pandas as pd
 from typing import List, Dict, Optional, Tuple, Any
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import logging
 import time
-from datetime import datetime, timedelta
-import pytz
-from urllib.parse import urljoin
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin, urlparse
 import re
 import functools
 import hashlib
@@ -23,6 +25,31 @@ logger = logging.getLogger(__name__)
 _content_cache = {}
 _metadata_cache = {}
 
+# Limits for fetch_full_contents: concurrent fetches overall and per host
+FETCH_CONCURRENCY = 32
+FETCH_PER_HOST = 4
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+@functools.lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Process-wide session so page fetches reuse keep-alive connections across scans"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+def _fetch_html(url: str) -> Optional[bytes]:
+    """Download a page over the shared session; None unless it returns 200.
+    Returns raw bytes so trafilatura detects the charset, as fetch_url did,
+    instead of requests guessing ISO-8859-1 for headers without one."""
+    response = _get_http_session().get(url, timeout=30)
+    if response.status_code != 200:
+        return None
+    return response.content
+
 class TooManyRequestsError(Exception):
     pass
 
@@ -90,8 +117,8 @@ def extract_metadata(url: str, cutoff_time: datetime) -> Optional[Dict[str, str]
                 logger.info(f"Using cached metadata for {url}")
                 return meta_data
 
-        # Fetch the content - trafilatura doesn't support timeout parameter directly
-        downloaded = trafilatura.fetch_url(url)
+        # Fetch the content
+        downloaded = _fetch_html(url)
         if not downloaded:
             logger.warning(f"Failed to download content from {url}")
             return None
@@ -112,7 +139,7 @@ def extract_metadata(url: str, cutoff_time: datetime) -> Optional[Dict[str, str]
                 meta_dict = json.loads(metadata)
                 result = {
                     'title': meta_dict.get('title', '').strip(),
-                    'date': meta_dict.get('date', datetime.now(pytz.UTC).strftime('%Y-%m-%d')),
+                    'date': meta_dict.get('date', datetime.now(timezone.utc).strftime('%Y-%m-%d')),
                     'url': url
                 }
 
@@ -125,7 +152,7 @@ def extract_metadata(url: str, cutoff_time: datetime) -> Optional[Dict[str, str]
                 # Fallback metadata
                 result = {
                     'title': "Article from " + url.split('/')[2],
-                    'date': datetime.now(pytz.UTC).strftime('%Y-%m-%d'),
+                    'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
                     'url': url
                 }
                 return result
@@ -144,20 +171,11 @@ def extract_full_content(url: str) -> Optional[str]:
 
     for attempt in range(max_retries):
         try:
-            # Use trafilatura to get content
-            downloaded = trafilatura.fetch_url(url)
+            # Download over the shared session, then extract with trafilatura
+            downloaded = _fetch_html(url)
             if downloaded:
-                content = trafilatura.extract(
-                    downloaded,
-                    include_links=True,
-                    include_images=True,
-                    include_tables=True,
-                    with_metadata=False,
-                    favor_recall=True
-                )
+                content = _extract_text(downloaded)
                 if content:
-                    # Clean whitespace and normalize content
-                    content = re.sub(r'\s+', ' ', content).strip()
                     return content
 
             # Exponential backoff between retries
@@ -178,6 +196,82 @@ def extract_full_content(url: str) -> Optional[str]:
     logger.warning(f"Failed to extract content from {url} after {max_retries} attempts")
     return None
 
+def _extract_text(downloaded: bytes) -> Optional[str]:
+    """Extract an article's main text from its HTML, with whitespace normalized"""
+    content = trafilatura.extract(
+        downloaded,
+        include_links=True,
+        include_images=True,
+        include_tables=True,
+        with_metadata=False,
+        favor_recall=True
+    )
+    if content:
+        # Clean whitespace and normalize content
+        content = re.sub(r'\s+', ' ', content).strip()
+    return content
+
+async def _afetch_full_content(client: httpx.AsyncClient, url: str,
+                               limit: asyncio.Semaphore, host_limit: asyncio.Semaphore) -> Optional[str]:
+    """Async counterpart of extract_full_content, sharing its cache and retry schedule"""
+    cache_key = f"extract_full_content:{url}"
+    if cache_key in _content_cache:
+        timestamp, result = _content_cache[cache_key]
+        if time.time() - timestamp < 43200:  # 12 hours, as for extract_full_content
+            logger.info(f"Using cached content for {url}")
+            return result
+
+    max_retries = 3
+    retry_delay = 2
+    for attempt in range(max_retries):
+        try:
+            # Wait for the host's slot before taking a global one, so requests
+            # queued on one busy host don't hold slots other hosts could use
+            async with host_limit, limit:
+                response = await client.get(url)
+            if response.status_code == 200 and response.content:
+                # Parsing is CPU-bound, so keep it off the event loop. Raw bytes
+                # let trafilatura detect the charset, as in _fetch_html
+                content = await asyncio.to_thread(_extract_text, response.content)
+                if content:
+                    _content_cache[cache_key] = (time.time(), content)
+                    return content
+        except Exception as e:
+            logger.error(f"Error extracting content from {url} (attempt {attempt + 1}): {str(e)}")
+
+        if attempt < max_retries - 1:
+            wait_time = retry_delay * (2 ** attempt)
+            logger.info(f"Retry {attempt+1}/{max_retries} for {url} in {wait_time}s")
+            await asyncio.sleep(wait_time)
+
+    logger.warning(f"Failed to extract content from {url} after {max_retries} attempts")
+    return None
+
+async def _afetch_full_contents(urls: List[str]) -> List[Optional[str]]:
+    """Fetch every URL over one connection pool, bounded overall and per host"""
+    limit = asyncio.Semaphore(FETCH_CONCURRENCY)
+    host_limits = {}
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        follow_redirects=True,
+        headers={'User-Agent': USER_AGENT},
+        limits=httpx.Limits(max_connections=64)
+    ) as client:
+        tasks = []
+        for url in urls:
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(FETCH_PER_HOST)
+            tasks.append(_afetch_full_content(client, url, limit, host_limits[host]))
+        return await asyncio.gather(*tasks)
+
+def fetch_full_contents(urls: List[str]) -> List[Optional[str]]:
+    """Extract full content for many URLs concurrently; results line up with urls"""
+    if not urls:
+        return []
+    return asyncio.run(_afetch_full_contents(urls))
+
 def is_consent_or_main_page(text: str) -> bool:
     """Check if the page is a consent form or main landing page."""
     consent_indicators = [
@@ -193,17 +287,13 @@ def is_consent_or_main_page(text: str) -> bool:
 
 def make_request_with_backoff(url: str, max_retries: int = 3, initial_delay: int = 5) -> Optional[requests.Response]:
     """Make HTTP request with exponential backoff."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     for attempt in range(max_retries):
         try:
             delay = initial_delay * (2 ** attempt)
             if attempt > 0:
                 time.sleep(delay)
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _get_http_session().get(url, timeout=10)
             response.raise_for_status()
             return response
 
@@ -277,6 +367,12 @@ def is_specific_article(metadata: Dict[str, str]) -> bool:
 
     return True
 
+def _parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date as midnight UTC; much cheaper than strptime"""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d'")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), tzinfo=timezone.utc)
+
 def clean_article_title(title):
     """Remove 'Permalink to' prefix and other common prefixes from article titles"""
     if title.startswith("Permalink to "):
@@ -312,13 +408,8 @@ def process_link(link, source_url, ai_regex, cutoff_time, seen_urls):
 
         # Parse the article date
         try:
-            article_date = datetime.strptime(metadata['date'], '%Y-%m-%d')
-            # Add UTC timezone to match cutoff_time
-            article_date = pytz.UTC.localize(article_date)
-
-            # Ensure cutoff_time is timezone aware
-            if not cutoff_time.tzinfo:
-                cutoff_time = pytz.UTC.localize(cutoff_time)
+            # Parsed as UTC to match cutoff_time
+            article_date = _parse_ymd(metadata['date'])
 
             # Add debugging for date comparison
             logger.info(f"Article date: {article_date}, Cutoff time: {cutoff_time}")
@@ -347,6 +438,9 @@ def process_link(link, source_url, ai_regex, cutoff_time, seen_urls):
 
 def find_ai_articles(source_url, cutoff_time):
     """Find AI-related articles from a source URL using parallel processing"""
+    # Make the cutoff timezone aware once instead of per article
+    if cutoff_time.tzinfo is None:
+        cutoff_time = cutoff_time.replace(tzinfo=timezone.utc)
     logger.info(f"Searching with cutoff time: {cutoff_time}")
     articles = []
     seen_urls = set()
@@ -6,6 +6,9 @@ import json
 class DBManager:
     def __init__(self):
         self.conn = sqlite3.connect('articles.db')
+        # WAL lets readers proceed during writes; NORMAL skips an fsync per commit
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
         self.create_tables()
         
     def create_tables(self):
@@ -24,19 +27,22 @@ class DBManager:
         self.conn.commit()
         
     def save_article(self, article):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO articles (url, title, date, content, summary, ai_validation)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            article['url'],
-            article['title'],
-            article['date'],
-            article.get('content', ''),
-            article.get('summary', ''),
-            article.get('ai_validation', '')
-        ))
-        self.conn.commit()
+        self.save_articles([article])
+
+    def save_articles(self, articles):
+        """Save many articles with one statement and a single commit"""
+        with self.conn:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO articles (url, title, date, content, summary, ai_validation)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(
+                article['url'],
+                article['title'],
+                article['date'],
+                article.get('content', ''),
+                article.get('summary', ''),
+                article.get('ai_validation', '')
+            ) for article in articles])
         
     def get_articles(self, limit=None):
         cursor = self.conn.cursor()
@@ -145,17 +145,18 @@ def save_reports(pdf_data, csv_data, excel_data, report_dir):
     with open(excel_path, "wb") as excel_file:
         excel_file.write(excel_data)
 
-#Example usage
-articles = [
-    {'title': 'Article 1', 'date': '2024-10-27', 'url': 'https://example.com/article1', 'takeaway': 'Takeaway 1'},
-    {'title': 'Article 2', 'date': '2024-10-26', 'url': 'https://example.com/article2', 'takeaway': 'Takeaway 2'}
-]
+if __name__ == "__main__":
+    # Example usage
+    articles = [
+        {'title': 'Article 1', 'date': '2024-10-27', 'url': 'https://example.com/article1', 'takeaway': 'Takeaway 1'},
+        {'title': 'Article 2', 'date': '2024-10-26', 'url': 'https://example.com/article2', 'takeaway': 'Takeaway 2'}
+    ]
 
-report_dir = "./reports" #replace with your report directory
-os.makedirs(report_dir, exist_ok=True)
+    report_dir = "./reports" #replace with your report directory
+    os.makedirs(report_dir, exist_ok=True)
 
-pdf_report_data = generate_pdf_report(articles)
-csv_report_data = generate_csv_report(articles)
-excel_report_data = generate_excel_report(articles)
+    pdf_report_data = generate_pdf_report(articles)
+    csv_report_data = generate_csv_report(articles)
+    excel_report_data = generate_excel_report(articles)
 
-save_reports(pdf_report_data, csv_report_data, excel_report_data, report_dir)
\ No newline at end of file
+    save_reports(pdf_report_data, csv_report_data, excel_report_data, report_dir)